@@ -525,7 +525,7 @@ class ConversationManager:
             )
 
             # Handle tool calls
-            if response.has_tool_calls and response.tool_calls:
+            if response.tool_calls:
                 # Add assistant message with tool calls
                 messages.append(
                     Message.assistant(
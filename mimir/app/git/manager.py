@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -100,6 +101,23 @@ Thumbs.db
 """
 
 
+def _parse_commit_line(line: str) -> dict[str, Any] | None:
+    """Parse a '%H|%s|%an|%aI' log line into a commit info dict.
+
+    The date is the last field, so anything after the third separator is
+    kept intact.
+
+    Returns:
+        Commit info dict, or None if the line is incomplete.
+    """
+    sha, _, rest = line.partition("|")
+    message, _, rest = rest.partition("|")
+    author, sep, date = rest.partition("|")
+    if not sep:
+        return None
+    return {"sha": sha, "message": message, "author": author, "date": date}
+
+
 @dataclass
 class GitConfig:
     """Git configuration."""
@@ -108,6 +126,7 @@ class GitConfig:
     author_name: str = "Mimir"
     author_email: str = "mimir@asgard.local"
     enabled: bool = True
+    max_concurrent_git: int = 4
 
 
 class GitManager:
@@ -122,43 +141,52 @@ class GitManager:
         self._config = config or GitConfig()
         self._repo_path = Path(self._config.repo_path)
         self._initialized = False
+        # Cap concurrent git processes when callers gather several operations
+        self._git_sem = asyncio.Semaphore(self._config.max_concurrent_git)
 
     @property
     def enabled(self) -> bool:
         """Check if git is enabled."""
         return self._config.enabled
 
-    async def _run_git(self, *args: str, timeout: float = 30.0) -> tuple[str, str, int]:
+    async def _run_git(
+        self, *args: str, timeout: float = 30.0, strip: bool = True
+    ) -> tuple[str, str, int]:
         """Run a git command.
 
         Args:
             *args: Git command arguments.
             timeout: Timeout in seconds (default 30).
+            strip: Strip surrounding whitespace from stdout. Disable for
+                formats where leading spaces are significant (porcelain).
 
         Returns:
             Tuple of (stdout, stderr, returncode).
         """
         cmd = ["git", "-C", str(self._repo_path), *args]
-        logger.debug("Running: %s", " ".join(cmd))
-
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-
-        try:
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
-            return (
-                stdout.decode("utf-8", errors="replace").strip(),
-                stderr.decode("utf-8", errors="replace").strip(),
-                process.returncode or 0,
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Running: %s", " ".join(cmd))
+
+        async with self._git_sem:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
-        except TimeoutError:
-            process.kill()
-            await process.wait()
-            logger.warning("Git command timed out: %s", " ".join(cmd))
-            return ("", "Command timed out", 1)
+
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+                out = stdout.decode("utf-8", errors="replace")
+                return (
+                    out.strip() if strip else out,
+                    stderr.decode("utf-8", errors="replace").strip(),
+                    process.returncode or 0,
+                )
+            except TimeoutError:
+                process.kill()
+                await process.wait()
+                logger.warning("Git command timed out: %s", " ".join(cmd))
+                return ("", "Command timed out", 1)
 
     async def _ensure_gitignore(self) -> bool:
         """Ensure .gitignore exists and is up to date.
@@ -254,21 +282,31 @@ class GitManager:
         Returns:
             Generated commit message.
         """
-        stdout, _stderr, code = await self._run_git("status", "--porcelain")
+        stdout, _stderr, code = await self._run_git("status", "--porcelain", "-z", strip=False)
         if code != 0 or not stdout:
             return "Update configuration"
 
-        lines = [line for line in stdout.split("\n") if line.strip()]
         changes: dict[str, list[str]] = {"added": [], "modified": [], "deleted": []}
+        total = 0
 
-        for line in lines:
-            status = line[:2].strip()
-            filepath = line[3:].strip()
-            filename = filepath.split("/")[-1]
+        # -z records are "XY path", NUL-terminated; renames/copies are followed
+        # by an extra record holding the original path.
+        records = iter(stdout.split("\0"))
+        for record in records:
+            if len(record) < 4:
+                continue
+            total += 1
+            x = record[0]
+            y = record[1]
+            slash = record.rfind("/", 3)
+            filename = record[slash + 1 :] if slash != -1 else record[3:]
+
+            if x == "R" or x == "C":
+                next(records, None)
 
-            if status in ("A", "??"):
+            if x == "A" or x == "?":
                 changes["added"].append(filename)
-            elif status == "D":
+            elif x == "D" or y == "D":
                 changes["deleted"].append(filename)
             else:
                 changes["modified"].append(filename)
@@ -309,7 +347,6 @@ class GitManager:
         if not parts:
             return "Update configuration"
 
-        total = len(lines)
         action = "Update"
         if changes["added"] and not changes["modified"] and not changes["deleted"]:
             action = "Add"
@@ -400,16 +437,7 @@ class GitManager:
         if code != 0 or not stdout:
             return {}
 
-        parts = stdout.split("|", 3)
-        if len(parts) < 4:
-            return {}
-
-        return {
-            "sha": parts[0],
-            "message": parts[1],
-            "author": parts[2],
-            "date": parts[3],
-        }
+        return _parse_commit_line(stdout) or {}
 
     async def get_commits(self, limit: int = 20) -> list[dict[str, Any]]:
         """Get recent commits.
@@ -434,18 +462,9 @@ class GitManager:
 
         commits = []
         for line in stdout.split("\n"):
-            if not line:
-                continue
-            parts = line.split("|", 3)
-            if len(parts) >= 4:
-                commits.append(
-                    {
-                        "sha": parts[0],
-                        "message": parts[1],
-                        "author": parts[2],
-                        "date": parts[3],
-                    }
-                )
+            commit = _parse_commit_line(line)
+            if commit:
+                commits.append(commit)
 
         return commits
 
@@ -2,16 +2,64 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
+import logging
 import os
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
+import orjson
+from yarl import URL
 
 from ..utils.logging import get_logger
 from .types import EntityState, Service
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Mapping
+
 logger = get_logger(__name__)
 
+# Total seconds allowed for one REST request, including reading the body
+REQUEST_TIMEOUT = 30.0
+
+# Seconds to wait for a WebSocket command result
+WS_COMMAND_TIMEOUT = 30.0
+
+# Seconds between WebSocket ping frames keeping the idle registry connection alive
+WS_HEARTBEAT = 30.0
+
+# GET endpoints whose parsed responses are memoized, with their TTL in seconds.
+# Any write (POST/DELETE) drops the cache since reloads can change these.
+CACHED_GET_TTL: dict[str, float] = {
+    "config": 60.0,
+    "services": 60.0,
+}
+
+# Parameterless WebSocket list commands memoized the same way, sharing the
+# GET cache so that writes over either transport invalidate them.
+CACHED_WS_TTL: dict[str, float] = {
+    "config/entity_registry/list": 30.0,
+    "config/area_registry/list": 60.0,
+    "config/label_registry/list": 60.0,
+}
+
+# Maximum concurrent config writes issued by the bulk create helpers
+BULK_CONFIG_CONCURRENCY = 8
+
+
+@functools.lru_cache(maxsize=128)
+def _history_filter(entity_ids: tuple[str, ...]) -> str:
+    """Join entity IDs for the history filter_entity_id parameter.
+
+    Scheduled history queries tend to repeat the same entity list, so the
+    joined string is memoized. Order is preserved since HA returns one
+    history list per entity in that order.
+    """
+    return ",".join(entity_ids)
+
 
 class HomeAssistantAPIError(Exception):
     """Raised when an API call fails."""
@@ -46,34 +94,72 @@ class HomeAssistantAPI:
         if supervisor_token and not url:
             # Running as add-on with token - use Supervisor proxy
             self._base_url = "http://supervisor/core/api"
+            self._ws_url = "ws://supervisor/core/websocket"
             self._token = supervisor_token
             logger.info("Using Supervisor API proxy")
         elif not url:
             # Running as add-on without token - try internal Docker network
             # The 'homeassistant' hostname is available on the Docker network
             self._base_url = "http://homeassistant:8123/api"
+            self._ws_url = "ws://homeassistant:8123/api/websocket"
             self._token = supervisor_token or ""
             logger.info("Using internal Docker network: %s", self._base_url)
         else:
             # Explicit URL provided
             self._base_url = f"{url.rstrip('/')}/api"
+            # Convert http(s) REST URL to ws(s) WebSocket URL
+            self._ws_url = f"{self._base_url}/websocket".replace("http", "ws", 1)
             self._token = token or ""
             logger.info("Using direct API connection: %s", self._base_url)
 
-        self._session: aiohttp.ClientSession | None = None
+        self._base = URL(self._base_url)
 
-    @property
-    def _headers(self) -> dict[str, str]:
-        """Get request headers."""
-        return {
+        # Built once and handed to the session so requests don't rebuild it
+        self._headers: dict[str, str] = {
             "Authorization": f"Bearer {self._token}",
             "Content-Type": "application/json",
         }
+        self._session: aiohttp.ClientSession | None = None
+        self._ping_method = "HEAD"
+
+        # url or WS command type -> (stored_at, etag, parsed response)
+        self._response_cache: dict[str, tuple[float, str | None, Any]] = {}
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+        self._cache_generation = 0
+        self._services_cache: tuple[Any, dict[str, list[Service]]] | None = None
+
+        # Persistent authenticated WebSocket for registry commands
+        self._ws: aiohttp.ClientWebSocketResponse | None = None
+        self._ws_msg_id = 0
+        self._ws_lock = asyncio.Lock()
+        self._ws_pending: dict[int, asyncio.Future[dict[str, Any]]] = {}
+        self._ws_reader_task: asyncio.Task[None] | None = None
+
+    def set_token(self, token: str) -> None:
+        """Replace the access token used for subsequent requests.
+
+        Args:
+            token: The new access token.
+        """
+        self._token = token
+        self._headers["Authorization"] = f"Bearer {token}"
+        if self._session is not None and not self._session.closed:
+            self._session.headers["Authorization"] = self._headers["Authorization"]
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
         """Ensure we have an active session."""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            connector = aiohttp.TCPConnector(
+                limit=32,
+                limit_per_host=16,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self._headers,
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+            )
         return self._session
 
     async def _request(
@@ -81,34 +167,101 @@ class HomeAssistantAPI:
         method: str,
         endpoint: str,
         data: dict[str, Any] | None = None,
+        params: dict[str, str] | None = None,
     ) -> Any:
         """Make an API request."""
         session = await self._ensure_session()
-        url = f"{self._base_url}/{endpoint.lstrip('/')}"
+        url = self._base / endpoint.lstrip("/")
+        if params:
+            url = url.with_query(params)
+
+        if method != "GET":
+            self._invalidate_cache()
+        else:
+            ttl = CACHED_GET_TTL.get(endpoint)
+            if ttl is not None:
+                return await self._cached_get(session, url, ttl)
 
-        logger.debug("%s %s", method, url)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s %s", method, url)
 
         try:
-            async with session.request(
-                method,
-                url,
-                headers=self._headers,
-                json=data,
-            ) as response:
-                if response.status >= 400:
-                    text = await response.text()
-                    raise HomeAssistantAPIError(response.status, text)
+            # Serialize straight to bytes; Content-Type comes from the session headers
+            body = orjson.dumps(data) if data is not None else None
+            async with session.request(method, url, data=body) as response:
+                return await self._read_response(response)
+
+        except aiohttp.ClientError as e:
+            raise HomeAssistantAPIError(0, str(e)) from e
+        except TimeoutError as e:
+            raise HomeAssistantAPIError(0, "timeout") from e
+
+    @staticmethod
+    async def _read_response(response: aiohttp.ClientResponse) -> Any:
+        """Raise on error status, otherwise return the parsed body."""
+        if response.status >= 400:
+            text = await response.text()
+            raise HomeAssistantAPIError(response.status, text)
+
+        if response.content_type == "application/json":
+            return await response.json(loads=orjson.loads)
+        return await response.text()
+
+    def _invalidate_cache(self) -> None:
+        """Drop memoized GET responses."""
+        self._cache_generation += 1
+        self._response_cache.clear()
+
+    async def _cached_get(self, session: aiohttp.ClientSession, url: URL, ttl: float) -> Any:
+        """GET with TTL memoization, ETag revalidation and in-flight de-duplication."""
+        key = str(url)
+        cached = self._response_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[2]
+
+        # Concurrent callers share a single round-trip
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._revalidate(session, url, cached))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def _revalidate(
+        self,
+        session: aiohttp.ClientSession,
+        url: URL,
+        cached: tuple[float, str | None, Any] | None,
+    ) -> Any:
+        """Fetch a cacheable endpoint, reusing the cached value on 304."""
+        etag = cached[1] if cached else None
+        headers = {"If-None-Match": etag} if etag else None
+        generation = self._cache_generation
 
-                if response.content_type == "application/json":
-                    return await response.json()
-                return await response.text()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("GET %s (cached)", url)
+
+        try:
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304 and cached is not None:
+                    value = cached[2]
+                else:
+                    value = await self._read_response(response)
+                etag = response.headers.get("ETag", etag)
 
         except aiohttp.ClientError as e:
             raise HomeAssistantAPIError(0, str(e)) from e
+        except TimeoutError as e:
+            raise HomeAssistantAPIError(0, "timeout") from e
 
-    async def get(self, endpoint: str) -> Any:
+        # Don't store a response that raced with a write
+        if generation == self._cache_generation:
+            self._response_cache[str(url)] = (time.monotonic(), etag, value)
+        return value
+
+    async def get(self, endpoint: str, params: dict[str, str] | None = None) -> Any:
         """Make a GET request."""
-        return await self._request("GET", endpoint)
+        return await self._request("GET", endpoint, params=params)
 
     async def post(self, endpoint: str, data: dict[str, Any] | None = None) -> Any:
         """Make a POST request."""
@@ -121,22 +274,48 @@ class HomeAssistantAPI:
     # High-level API methods
 
     async def ping(self) -> bool:
-        """Check if Home Assistant is reachable."""
+        """Check if Home Assistant is reachable.
+
+        Only the status code matters, so a HEAD request is tried first and the
+        body is never read. HA core only routes GET on /api/, so a 405 switches
+        this client to a bodiless GET for subsequent pings.
+        """
+        session = await self._ensure_session()
+        url = self._base / ""
         try:
-            await self.get("")
-            return True
-        except HomeAssistantAPIError:
+            if self._ping_method == "HEAD":
+                async with session.head(url) as response:
+                    if response.status != 405:
+                        return response.status < 400
+                self._ping_method = "GET"
+
+            async with session.get(url) as response:
+                return response.status < 400
+        except (aiohttp.ClientError, TimeoutError):
             return False
 
     async def get_config(self) -> dict[str, Any]:
-        """Get Home Assistant configuration."""
+        """Get Home Assistant configuration.
+
+        The result is memoized and the same dict is returned to every caller
+        until it expires or a write drops it. Don't mutate it.
+        """
         result: dict[str, Any] = await self.get("config")
         return result
 
     async def get_states(self) -> list[EntityState]:
         """Get all entity states."""
-        data = await self.get("states")
-        return [EntityState.from_dict(s) for s in data]
+        data = await self.get_states_raw()
+        from_dict = EntityState.from_dict
+        return [from_dict(s) for s in data]
+
+    async def get_states_raw(self) -> list[dict[str, Any]]:
+        """Get all entity states as parsed JSON, without building EntityState objects.
+
+        Cheaper on large instances for callers that only read a few fields.
+        """
+        result: list[dict[str, Any]] = await self.get("states")
+        return result
 
     async def get_state(self, entity_id: str) -> EntityState:
         """Get state of a specific entity."""
@@ -144,15 +323,25 @@ class HomeAssistantAPI:
         return EntityState.from_dict(data)
 
     async def get_services(self) -> dict[str, list[Service]]:
-        """Get all available services."""
+        """Get all available services.
+
+        The result is memoized and the same dict is returned to every caller
+        until it expires or a write drops it. Don't mutate it.
+        """
         data = await self.get("services")
-        result: dict[str, list[Service]] = {}
-        for domain_data in data:
-            domain = domain_data["domain"]
-            services = []
-            for service_name, service_data in domain_data.get("services", {}).items():
-                services.append(Service.from_dict(domain, service_name, service_data))
-            result[domain] = services
+        if self._services_cache is not None and self._services_cache[0] is data:
+            return self._services_cache[1]
+
+        from_dict = Service.from_dict
+        result: dict[str, list[Service]] = {
+            domain_data["domain"]: [
+                from_dict(domain_data["domain"], service_name, service_data)
+                for service_name, service_data in domain_data.get("services", {}).items()
+            ]
+            for domain_data in data
+        }
+
+        self._services_cache = (data, result)
         return result
 
     async def call_service(
@@ -192,15 +381,13 @@ class HomeAssistantAPI:
         endpoint = "logbook"
         if start_time:
             endpoint += f"/{start_time}"
-        params = []
+        params: dict[str, str] = {}
         if entity_id:
-            params.append(f"entity={entity_id}")
+            params["entity"] = entity_id
         if end_time:
-            params.append(f"end_time={end_time}")
-        if params:
-            endpoint += "?" + "&".join(params)
+            params["end_time"] = end_time
 
-        result: list[dict[str, Any]] = await self.get(endpoint)
+        result: list[dict[str, Any]] = await self.get(endpoint, params)
         return result
 
     async def get_history(
@@ -210,16 +397,48 @@ class HomeAssistantAPI:
         end_time: str | None = None,
     ) -> list[list[EntityState]]:
         """Get entity history."""
+        data = await self.get_history_raw(entity_ids, start_time, end_time)
+        from_dict = EntityState.from_dict
+        return [[from_dict(s) for s in entity_history] for entity_history in data]
+
+    async def get_history_raw(
+        self,
+        entity_ids: list[str],
+        start_time: str | None = None,
+        end_time: str | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Get entity history as parsed JSON, without building EntityState objects.
+
+        History is the largest payload HA returns; callers that only aggregate
+        a few fields should use this instead of get_history().
+        """
         endpoint = "history/period"
         if start_time:
             endpoint += f"/{start_time}"
-        params = [f"filter_entity_id={','.join(entity_ids)}"]
+        params = {"filter_entity_id": _history_filter(tuple(entity_ids))}
         if end_time:
-            params.append(f"end_time={end_time}")
-        endpoint += "?" + "&".join(params)
+            params["end_time"] = end_time
+
+        result: list[list[dict[str, Any]]] = await self.get(endpoint, params)
+        return result
+
+    async def iter_history(
+        self,
+        entity_ids: list[str],
+        start_time: str | None = None,
+        end_time: str | None = None,
+    ) -> AsyncIterator[EntityState]:
+        """Yield entity history one state at a time.
 
-        data = await self.get(endpoint)
-        return [[EntityState.from_dict(s) for s in entity_history] for entity_history in data]
+        Unlike get_history(), states are only materialized as they are consumed,
+        so callers that stop early or aggregate on the fly never hold the full
+        list of EntityState objects.
+        """
+        data = await self.get_history_raw(entity_ids, start_time, end_time)
+        from_dict = EntityState.from_dict
+        for entity_history in data:
+            for state in entity_history:
+                yield from_dict(state)
 
     async def send_telegram_message(
         self,
@@ -236,6 +455,67 @@ class HomeAssistantAPI:
 
         await self.call_service("telegram_bot", "send_message", service_data)
 
+    # Config CRUD operations (automations, scripts, scenes, helpers)
+
+    @staticmethod
+    def _strip_prefix(object_id: str, domain: str) -> str:
+        """Remove a leading '<domain>.' from an ID if present."""
+        if object_id.startswith(domain) and object_id.startswith(".", len(domain)):
+            return object_id[len(domain) + 1 :]
+        return object_id
+
+    async def _config_crud(
+        self,
+        method: str,
+        domain: str,
+        object_id: str,
+        data: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Get, create/update or delete a config entry via config/<domain>/config/<id>.
+
+        Args:
+            method: HTTP method (GET, POST or DELETE).
+            domain: The config domain (automation, script, scene, input_boolean, ...).
+            object_id: The ID, with or without the '<domain>.' prefix.
+            data: The configuration for POST requests.
+
+        Returns:
+            The parsed response.
+        """
+        object_id = self._strip_prefix(object_id, domain)
+        if method == "POST":
+            logger.info("Creating/updating %s: %s", domain, object_id)
+        elif method == "DELETE":
+            logger.info("Deleting %s: %s", domain, object_id)
+
+        result: dict[str, Any] = await self._request(
+            method, f"config/{domain}/config/{object_id}", data
+        )
+        return result
+
+    async def _config_create_many(
+        self, domain: str, items: Mapping[str, dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Create or update several config entries concurrently.
+
+        Writes share the pooled session and are bounded by
+        BULK_CONFIG_CONCURRENCY so HA isn't flooded with config reloads.
+
+        Args:
+            domain: The config domain (automation, script, scene, input_boolean, ...).
+            items: Mapping of ID to configuration.
+
+        Returns:
+            The results, in the same order as items.
+        """
+        sem = asyncio.Semaphore(BULK_CONFIG_CONCURRENCY)
+
+        async def create(object_id: str, config: dict[str, Any]) -> dict[str, Any]:
+            async with sem:
+                return await self._config_crud("POST", domain, object_id, config)
+
+        return await asyncio.gather(*(create(k, v) for k, v in items.items()))
+
     # Automation CRUD operations
 
     async def get_automation_config(self, automation_id: str) -> dict[str, Any]:
@@ -247,12 +527,7 @@ class HomeAssistantAPI:
         Returns:
             The automation configuration dict.
         """
-        # Remove 'automation.' prefix if present
-        if automation_id.startswith("automation."):
-            automation_id = automation_id[11:]
-
-        result: dict[str, Any] = await self.get(f"config/automation/config/{automation_id}")
-        return result
+        return await self._config_crud("GET", "automation", automation_id)
 
     async def create_automation(
         self,
@@ -268,16 +543,20 @@ class HomeAssistantAPI:
         Returns:
             The result of the operation.
         """
-        # Remove 'automation.' prefix if present
-        if automation_id.startswith("automation."):
-            automation_id = automation_id[11:]
+        return await self._config_crud("POST", "automation", automation_id, config)
 
-        logger.info("Creating/updating automation: %s", automation_id)
-        result: dict[str, Any] = await self.post(
-            f"config/automation/config/{automation_id}",
-            config,
-        )
-        return result
+    async def create_automations(
+        self, automations: Mapping[str, dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Create or update several automations concurrently.
+
+        Args:
+            automations: Mapping of automation ID to configuration.
+
+        Returns:
+            The results, in the same order as automations.
+        """
+        return await self._config_create_many("automation", automations)
 
     async def delete_automation(self, automation_id: str) -> dict[str, Any]:
         """Delete an automation.
@@ -288,13 +567,7 @@ class HomeAssistantAPI:
         Returns:
             The result of the operation.
         """
-        # Remove 'automation.' prefix if present
-        if automation_id.startswith("automation."):
-            automation_id = automation_id[11:]
-
-        logger.info("Deleting automation: %s", automation_id)
-        result: dict[str, Any] = await self.delete(f"config/automation/config/{automation_id}")
-        return result
+        return await self._config_crud("DELETE", "automation", automation_id)
 
     # Script CRUD operations
 
@@ -307,11 +580,7 @@ class HomeAssistantAPI:
         Returns:
             The script configuration dict.
         """
-        if script_id.startswith("script."):
-            script_id = script_id[7:]
-
-        result: dict[str, Any] = await self.get(f"config/script/config/{script_id}")
-        return result
+        return await self._config_crud("GET", "script", script_id)
 
     async def create_script(
         self,
@@ -327,15 +596,18 @@ class HomeAssistantAPI:
         Returns:
             The result of the operation.
         """
-        if script_id.startswith("script."):
-            script_id = script_id[7:]
+        return await self._config_crud("POST", "script", script_id, config)
 
-        logger.info("Creating/updating script: %s", script_id)
-        result: dict[str, Any] = await self.post(
-            f"config/script/config/{script_id}",
-            config,
-        )
-        return result
+    async def create_scripts(self, scripts: Mapping[str, dict[str, Any]]) -> list[dict[str, Any]]:
+        """Create or update several scripts concurrently.
+
+        Args:
+            scripts: Mapping of script ID to configuration.
+
+        Returns:
+            The results, in the same order as scripts.
+        """
+        return await self._config_create_many("script", scripts)
 
     async def delete_script(self, script_id: str) -> dict[str, Any]:
         """Delete a script.
@@ -346,12 +618,7 @@ class HomeAssistantAPI:
         Returns:
             The result of the operation.
         """
-        if script_id.startswith("script."):
-            script_id = script_id[7:]
-
-        logger.info("Deleting script: %s", script_id)
-        result: dict[str, Any] = await self.delete(f"config/script/config/{script_id}")
-        return result
+        return await self._config_crud("DELETE", "script", script_id)
 
     # Scene CRUD operations
 
@@ -364,11 +631,7 @@ class HomeAssistantAPI:
         Returns:
             The scene configuration dict.
         """
-        if scene_id.startswith("scene."):
-            scene_id = scene_id[6:]
-
-        result: dict[str, Any] = await self.get(f"config/scene/config/{scene_id}")
-        return result
+        return await self._config_crud("GET", "scene", scene_id)
 
     async def create_scene(
         self,
@@ -384,15 +647,18 @@ class HomeAssistantAPI:
         Returns:
             The result of the operation.
         """
-        if scene_id.startswith("scene."):
-            scene_id = scene_id[6:]
+        return await self._config_crud("POST", "scene", scene_id, config)
 
-        logger.info("Creating/updating scene: %s", scene_id)
-        result: dict[str, Any] = await self.post(
-            f"config/scene/config/{scene_id}",
-            config,
-        )
-        return result
+    async def create_scenes(self, scenes: Mapping[str, dict[str, Any]]) -> list[dict[str, Any]]:
+        """Create or update several scenes concurrently.
+
+        Args:
+            scenes: Mapping of scene ID to configuration.
+
+        Returns:
+            The results, in the same order as scenes.
+        """
+        return await self._config_create_many("scene", scenes)
 
     async def delete_scene(self, scene_id: str) -> dict[str, Any]:
         """Delete a scene.
@@ -403,12 +669,7 @@ class HomeAssistantAPI:
         Returns:
             The result of the operation.
         """
-        if scene_id.startswith("scene."):
-            scene_id = scene_id[6:]
-
-        logger.info("Deleting scene: %s", scene_id)
-        result: dict[str, Any] = await self.delete(f"config/scene/config/{scene_id}")
-        return result
+        return await self._config_crud("DELETE", "scene", scene_id)
 
     # Helper CRUD operations (input_boolean, input_number, input_text, etc.)
 
@@ -422,12 +683,7 @@ class HomeAssistantAPI:
         Returns:
             The helper configuration dict.
         """
-        prefix = f"{helper_type}."
-        if helper_id.startswith(prefix):
-            helper_id = helper_id[len(prefix) :]
-
-        result: dict[str, Any] = await self.get(f"config/{helper_type}/config/{helper_id}")
-        return result
+        return await self._config_crud("GET", helper_type, helper_id)
 
     async def create_helper(
         self,
@@ -445,16 +701,21 @@ class HomeAssistantAPI:
         Returns:
             The result of the operation.
         """
-        prefix = f"{helper_type}."
-        if helper_id.startswith(prefix):
-            helper_id = helper_id[len(prefix) :]
+        return await self._config_crud("POST", helper_type, helper_id, config)
 
-        logger.info("Creating/updating helper: %s.%s", helper_type, helper_id)
-        result: dict[str, Any] = await self.post(
-            f"config/{helper_type}/config/{helper_id}",
-            config,
-        )
-        return result
+    async def create_helpers(
+        self, helper_type: str, helpers: Mapping[str, dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Create or update several helpers of one type concurrently.
+
+        Args:
+            helper_type: The helper type (input_boolean, input_number, etc.).
+            helpers: Mapping of helper ID to configuration.
+
+        Returns:
+            The results, in the same order as helpers.
+        """
+        return await self._config_create_many(helper_type, helpers)
 
     async def delete_helper(self, helper_type: str, helper_id: str) -> dict[str, Any]:
         """Delete a helper.
@@ -466,84 +727,189 @@ class HomeAssistantAPI:
         Returns:
             The result of the operation.
         """
-        prefix = f"{helper_type}."
-        if helper_id.startswith(prefix):
-            helper_id = helper_id[len(prefix) :]
-
-        logger.info("Deleting helper: %s.%s", helper_type, helper_id)
-        result: dict[str, Any] = await self.delete(f"config/{helper_type}/config/{helper_id}")
-        return result
+        return await self._config_crud("DELETE", helper_type, helper_id)
 
     # Entity Registry operations (via WebSocket)
 
-    async def _ws_command(self, command_type: str, **kwargs: Any) -> dict[str, Any] | None:
-        """Send a WebSocket command and get the result.
-
-        Entity registry operations require WebSocket, not REST API.
-
-        Args:
-            command_type: The command type.
-            **kwargs: Command parameters.
+    async def _ensure_ws(self) -> aiohttp.ClientWebSocketResponse:
+        """Ensure we have an authenticated WebSocket connection.
 
-        Returns:
-            The result, or None if failed.
+        The connection is kept open and shared by all commands; a background
+        reader task routes each result to the command waiting on its id.
         """
-        import json
+        async with self._ws_lock:
+            if self._ws is not None and not self._ws.closed:
+                return self._ws
 
-        # Determine WebSocket URL based on REST URL
-        if "supervisor" in self._base_url:
-            ws_url = "ws://supervisor/core/websocket"
-        elif "homeassistant" in self._base_url:
-            ws_url = "ws://homeassistant:8123/api/websocket"
-        else:
-            # Convert http(s) REST URL to ws(s) WebSocket URL
-            ws_url = self._base_url.replace("/api", "/api/websocket")
-            ws_url = ws_url.replace("http://", "ws://").replace("https://", "wss://")
+            session = await self._ensure_session()
 
-        session = await self._ensure_session()
+            try:
+                ws = await session.ws_connect(self._ws_url, heartbeat=WS_HEARTBEAT)
+            except aiohttp.ClientError as e:
+                raise HomeAssistantAPIError(0, f"WebSocket error: {e}") from e
 
-        try:
-            async with session.ws_connect(ws_url) as ws:
+            try:
                 # Wait for auth_required
-                msg = await ws.receive()
-                if msg.type != aiohttp.WSMsgType.TEXT:
-                    raise HomeAssistantAPIError(0, f"Unexpected message type: {msg.type}")
-
-                data = json.loads(msg.data)
+                data = await ws.receive_json(loads=orjson.loads)
                 if data.get("type") != "auth_required":
                     raise HomeAssistantAPIError(0, f"Expected auth_required: {data}")
 
                 # Authenticate
-                await ws.send_json({"type": "auth", "access_token": self._token})
+                await ws.send_str(
+                    orjson.dumps({"type": "auth", "access_token": self._token}).decode()
+                )
 
-                msg = await ws.receive()
-                data = json.loads(msg.data)
+                data = await ws.receive_json(loads=orjson.loads)
                 if data.get("type") != "auth_ok":
                     raise HomeAssistantAPIError(401, "WebSocket authentication failed")
+            except TypeError as e:
+                # receive_json() raises this for close/error frames
+                await ws.close()
+                raise HomeAssistantAPIError(0, f"Unexpected WebSocket message: {e}") from e
+            except BaseException:
+                await ws.close()
+                raise
+
+            self._ws = ws
+            self._ws_msg_id = 0
+            self._ws_pending = {}
+            self._ws_reader_task = asyncio.create_task(self._ws_reader(ws, self._ws_pending))
+            return ws
+
+    async def _ws_reader(
+        self,
+        ws: aiohttp.ClientWebSocketResponse,
+        pending: dict[int, asyncio.Future[dict[str, Any]]],
+    ) -> None:
+        """Route incoming WebSocket results to their pending futures."""
+        try:
+            async for msg in ws:
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    continue
+                data = orjson.loads(msg.data)
+                future = pending.pop(data.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(data)
+        except Exception as e:
+            logger.warning("WebSocket reader stopped: %s", e)
+        finally:
+            if self._ws is ws:
+                self._ws = None
+            # Fail anything still waiting on this connection
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(HomeAssistantAPIError(0, "WebSocket connection closed"))
+            pending.clear()
+
+    async def _ws_send(self, command_type: str, **kwargs: Any) -> asyncio.Future[dict[str, Any]]:
+        """Send a WebSocket command and return a future for its result message."""
+        ws = await self._ensure_ws()
+
+        self._ws_msg_id += 1
+        msg_id = self._ws_msg_id
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        pending = self._ws_pending
+        pending[msg_id] = future
+        # The reader only pops ids that get a reply; a timed-out or abandoned
+        # command is cancelled instead, and must not stay registered
+        future.add_done_callback(lambda _: pending.pop(msg_id, None))
+
+        command = {"id": msg_id, "type": command_type, **kwargs}
+        try:
+            await ws.send_str(orjson.dumps(command).decode())
+        except (aiohttp.ClientError, ConnectionError) as e:
+            self._ws_pending.pop(msg_id, None)
+            await self._close_ws()
+            raise HomeAssistantAPIError(0, f"WebSocket error: {e}") from e
+        return future
+
+    @staticmethod
+    def _ws_result(data: dict[str, Any]) -> Any:
+        """Extract the result from a WebSocket result message, raising on failure."""
+        if data.get("success"):
+            return data.get("result")
+        error = data.get("error", {})
+        raise HomeAssistantAPIError(
+            0, f"WebSocket command failed: {error.get('message', 'Unknown error')}"
+        )
 
-                # Send command
-                command = {"id": 1, "type": command_type, **kwargs}
-                await ws.send_json(command)
+    async def _ws_command(self, command_type: str, **kwargs: Any) -> dict[str, Any] | None:
+        """Send a WebSocket command and get the result.
 
-                # Wait for result
-                msg = await ws.receive()
-                data = json.loads(msg.data)
+        Entity registry operations require WebSocket, not REST API.
 
-                if data.get("success"):
-                    result: dict[str, Any] | None = data.get("result")
-                    return result
-                else:
-                    error = data.get("error", {})
-                    raise HomeAssistantAPIError(
-                        0, f"WebSocket command failed: {error.get('message', 'Unknown error')}"
-                    )
+        Args:
+            command_type: The command type.
+            **kwargs: Command parameters.
 
-        except aiohttp.ClientError as e:
-            raise HomeAssistantAPIError(0, f"WebSocket error: {e}") from e
+        Returns:
+            The result, or None if failed.
+        """
+        ttl = None if kwargs else CACHED_WS_TTL.get(command_type)
+        if ttl is not None:
+            cached = self._response_cache.get(command_type)
+            if cached is not None and time.monotonic() - cached[0] < ttl:
+                cached_result: dict[str, Any] | None = cached[2]
+                return cached_result
+        generation = self._cache_generation
+
+        future = await self._ws_send(command_type, **kwargs)
+        try:
+            async with asyncio.timeout(WS_COMMAND_TIMEOUT):
+                data = await future
+        except TimeoutError as e:
+            raise HomeAssistantAPIError(0, f"WebSocket command timed out: {command_type}") from e
+
+        result: dict[str, Any] | None = self._ws_result(data)
+        if ttl is not None and generation == self._cache_generation:
+            self._response_cache[command_type] = (time.monotonic(), None, result)
+        return result
+
+    async def _ws_commands_batch(self, commands: list[tuple[str, dict[str, Any]]]) -> list[Any]:
+        """Send several WebSocket commands at once and wait for all results.
+
+        All commands are pipelined over the shared connection, so the total
+        latency is that of the slowest command rather than the sum.
+
+        Args:
+            commands: List of (command_type, params) tuples.
+
+        Returns:
+            Results in the same order as the commands.
+        """
+        futures: list[asyncio.Future[dict[str, Any]]] = []
+        try:
+            for command_type, params in commands:
+                futures.append(await self._ws_send(command_type, **params))
+            async with asyncio.timeout(WS_COMMAND_TIMEOUT):
+                messages = await asyncio.gather(*futures)
+        except TimeoutError as e:
+            raise HomeAssistantAPIError(0, "WebSocket batch timed out") from e
+        finally:
+            # Cancelling unregisters the id; covers a failed send mid-batch too
+            for future in futures:
+                future.cancel()
+
+        return [self._ws_result(data) for data in messages]
+
+    async def _close_ws(self) -> None:
+        """Close the persistent WebSocket connection, if any."""
+        ws = self._ws
+        self._ws = None
+        if ws is not None and not ws.closed:
+            await ws.close()
+        if self._ws_reader_task is not None:
+            self._ws_reader_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._ws_reader_task
+            self._ws_reader_task = None
 
     async def get_entity_registry(self) -> list[dict[str, Any]]:
         """Get all entities from the entity registry.
 
+        The list is memoized and shared between callers until it expires or a
+        write drops it. Don't mutate it.
+
         Returns:
             List of entity registry entries.
         """
@@ -588,22 +954,22 @@ class HomeAssistantAPI:
         Returns:
             Updated entity registry entry.
         """
+        updates = {
+            "name": name,
+            "area_id": area_id,
+            "labels": labels,
+            "disabled_by": disabled_by,
+            "hidden_by": hidden_by,
+            "icon": icon,
+        }
         kwargs: dict[str, Any] = {"entity_id": entity_id}
-
-        if name is not None:
-            kwargs["name"] = name
-        if area_id is not None:
-            kwargs["area_id"] = area_id if area_id else None
-        if labels is not None:
-            kwargs["labels"] = labels
-        if disabled_by is not None:
-            kwargs["disabled_by"] = disabled_by
-        if hidden_by is not None:
-            kwargs["hidden_by"] = hidden_by
-        if icon is not None:
-            kwargs["icon"] = icon
+        kwargs.update((key, value) for key, value in updates.items() if value is not None)
+        if area_id == "":
+            # An empty string clears the area, which HA expects as null
+            kwargs["area_id"] = None
 
         logger.info("Updating entity registry: %s", entity_id)
+        self._invalidate_cache()
         result = await self._ws_command("config/entity_registry/update", **kwargs)
         if result is None:
             raise HomeAssistantAPIError(0, f"Failed to update entity: {entity_id}")
@@ -612,6 +978,9 @@ class HomeAssistantAPI:
     async def get_areas(self) -> list[dict[str, Any]]:
         """Get all areas.
 
+        The list is memoized and shared between callers until it expires or a
+        write drops it. Don't mutate it.
+
         Returns:
             List of area registry entries.
         """
@@ -623,6 +992,9 @@ class HomeAssistantAPI:
     async def get_labels(self) -> list[dict[str, Any]]:
         """Get all labels.
 
+        The list is memoized and shared between callers until it expires or a
+        write drops it. Don't mutate it.
+
         Returns:
             List of label registry entries.
         """
@@ -631,8 +1003,30 @@ class HomeAssistantAPI:
             return []
         return result if isinstance(result, list) else []
 
+    async def get_registries(
+        self,
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]:
+        """Get the entity, area and label registries in one round-trip.
+
+        Returns:
+            Tuple of (entities, areas, labels) registry entries.
+        """
+        entities, areas, labels = await self._ws_commands_batch(
+            [
+                ("config/entity_registry/list", {}),
+                ("config/area_registry/list", {}),
+                ("config/label_registry/list", {}),
+            ]
+        )
+        return (
+            entities if isinstance(entities, list) else [],
+            areas if isinstance(areas, list) else [],
+            labels if isinstance(labels, list) else [],
+        )
+
     async def close(self) -> None:
         """Close the API session."""
+        await self._close_ws()
         if self._session and not self._session.closed:
             await self._session.close()
             self._session = None
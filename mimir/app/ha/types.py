@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import contextlib
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityState:
     """State of a Home Assistant entity."""
 
@@ -27,14 +28,15 @@ class EntityState:
 
         if "last_changed" in data:
             with contextlib.suppress(ValueError, TypeError):
-                last_changed = datetime.fromisoformat(data["last_changed"].replace("Z", "+00:00"))
+                last_changed = datetime.fromisoformat(data["last_changed"])
 
         if "last_updated" in data:
             with contextlib.suppress(ValueError, TypeError):
-                last_updated = datetime.fromisoformat(data["last_updated"].replace("Z", "+00:00"))
+                last_updated = datetime.fromisoformat(data["last_updated"])
 
+        # IDs recur in every state and history fetch, so keep one copy of each
         return cls(
-            entity_id=data["entity_id"],
+            entity_id=sys.intern(data["entity_id"]),
             state=data["state"],
             attributes=data.get("attributes", {}),
             last_changed=last_changed,
@@ -43,7 +45,7 @@ class EntityState:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Entity:
     """A Home Assistant entity definition."""
 
@@ -58,7 +60,7 @@ class Entity:
     def from_dict(cls, data: dict[str, Any]) -> Entity:
         """Create Entity from API response."""
         return cls(
-            entity_id=data["entity_id"],
+            entity_id=sys.intern(data["entity_id"]),
             name=data.get("name"),
             area_id=data.get("area_id"),
             device_id=data.get("device_id"),
@@ -67,7 +69,7 @@ class Entity:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Service:
     """A Home Assistant service definition."""
 
@@ -76,25 +78,25 @@ class Service:
     name: str | None = None
     description: str | None = None
     fields: dict[str, Any] = field(default_factory=dict)
+    # The full service name (domain.service), built once since it's read repeatedly
+    full_name: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def full_name(self) -> str:
-        """Get the full service name (domain.service)."""
-        return f"{self.domain}.{self.service}"
+    def __post_init__(self) -> None:
+        self.full_name = f"{self.domain}.{self.service}"
 
     @classmethod
     def from_dict(cls, domain: str, service: str, data: dict[str, Any]) -> Service:
         """Create Service from API response."""
         return cls(
-            domain=domain,
-            service=service,
+            domain=sys.intern(domain),
+            service=sys.intern(service),
             name=data.get("name"),
             description=data.get("description"),
             fields=data.get("fields", {}),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """A Home Assistant event."""
 
@@ -110,10 +112,10 @@ class Event:
         time_fired = None
         if "time_fired" in data:
             with contextlib.suppress(ValueError, TypeError):
-                time_fired = datetime.fromisoformat(data["time_fired"].replace("Z", "+00:00"))
+                time_fired = datetime.fromisoformat(data["time_fired"])
 
         return cls(
-            event_type=data.get("event_type", ""),
+            event_type=sys.intern(data.get("event_type", "")),
             data=data.get("data", {}),
             origin=data.get("origin"),
             time_fired=time_fired,
@@ -121,7 +123,7 @@ class Event:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Automation:
     """A Home Assistant automation."""
 
@@ -134,7 +136,7 @@ class Automation:
     mode: str = "single"
 
 
-@dataclass
+@dataclass(slots=True)
 class Script:
     """A Home Assistant script."""
 
@@ -145,7 +147,7 @@ class Script:
     mode: str = "single"
 
 
-@dataclass
+@dataclass(slots=True)
 class Scene:
     """A Home Assistant scene."""
 
@@ -154,7 +156,7 @@ class Scene:
     entities: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class TelegramMessage:
     """A Telegram message from Home Assistant event."""
 
@@ -187,7 +189,7 @@ class TelegramMessage:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class UserContext:
     """Context about the current user interacting with Mímir.
 
@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import contextlib
+import logging
 import os
+from collections import defaultdict
 from collections.abc import Callable, Coroutine
 from typing import Any
 
 import aiohttp
+import orjson
 
 from ..utils.logging import get_logger
 from .types import Event
@@ -17,6 +20,12 @@ logger = get_logger(__name__)
 
 EventHandler = Callable[[Event], Coroutine[Any, Any, None]]
 
+# Events buffered between the socket reader and the dispatch worker
+EVENT_QUEUE_SIZE = 1024
+
+# Seconds to wait for a command or subscription result
+COMMAND_TIMEOUT = 30.0
+
 
 class HomeAssistantWebSocket:
     """WebSocket client for Home Assistant.
@@ -58,8 +67,13 @@ class HomeAssistantWebSocket:
         self._session: aiohttp.ClientSession | None = None
         self._ws: aiohttp.ClientWebSocketResponse | None = None
         self._message_id = 0
-        self._handlers: dict[str, list[EventHandler]] = {}
+        self._handlers: defaultdict[str, list[EventHandler]] = defaultdict(list)
+        # event_type -> specific + catch-all handlers, rebuilt after on_event()
+        self._dispatch_cache: dict[str, tuple[EventHandler, ...]] = {}
         self._subscriptions: dict[int, str] = {}  # message_id -> event_type
+        self._event_queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(EVENT_QUEUE_SIZE)
+        # message_id -> future resolved by the listen loop with the result message
+        self._pending: dict[int, asyncio.Future[dict[str, Any]]] = {}
         self._running = False
         self._reconnect_delay = 1.0
         self._max_reconnect_delay = 60.0
@@ -72,7 +86,10 @@ class HomeAssistantWebSocket:
     async def _ensure_session(self) -> aiohttp.ClientSession:
         """Ensure we have an active session."""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            # One live socket plus the one being replaced during a reconnect;
+            # the DNS cache spares a lookup on every reconnect.
+            connector = aiohttp.TCPConnector(limit=2, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(connector=connector)
         return self._session
 
     async def connect(self) -> bool:
@@ -89,13 +106,15 @@ class HomeAssistantWebSocket:
                 logger.error("Unexpected message type: %s", msg.type)
                 return False
 
-            data = json.loads(msg.data)
+            data = orjson.loads(msg.data)
             if data.get("type") != "auth_required":
                 logger.error("Expected auth_required, got: %s", data.get("type"))
                 return False
 
             # Send auth
-            await self._ws.send_json({"type": "auth", "access_token": self._token})
+            await self._ws.send_str(
+                orjson.dumps({"type": "auth", "access_token": self._token}).decode()
+            )
 
             # Wait for auth response
             msg = await self._ws.receive()
@@ -103,7 +122,7 @@ class HomeAssistantWebSocket:
                 logger.error("Unexpected message type: %s", msg.type)
                 return False
 
-            data = json.loads(msg.data)
+            data = orjson.loads(msg.data)
             if data.get("type") == "auth_ok":
                 logger.info("WebSocket authenticated successfully")
                 self._reconnect_delay = 1.0  # Reset on successful connect
@@ -125,10 +144,6 @@ class HomeAssistantWebSocket:
         Returns:
             Subscription ID, or None if failed.
         """
-        if not self._ws or self._ws.closed:
-            logger.error("WebSocket not connected")
-            return None
-
         msg_id = self._next_id()
         subscribe_msg: dict[str, Any] = {
             "id": msg_id,
@@ -137,25 +152,46 @@ class HomeAssistantWebSocket:
         if event_type:
             subscribe_msg["event_type"] = event_type
 
-        await self._ws.send_json(subscribe_msg)
-
-        # Wait for confirmation
-        async for msg in self._ws:
-            if msg.type != aiohttp.WSMsgType.TEXT:
-                continue
-
-            data = json.loads(msg.data)
-            if data.get("id") == msg_id:
-                if data.get("type") == "result" and data.get("success"):
-                    self._subscriptions[msg_id] = event_type or "*"
-                    logger.info("Subscribed to events: %s (id=%d)", event_type or "all", msg_id)
-                    return msg_id
-                else:
-                    logger.error("Subscription failed: %s", data)
-                    return None
+        data = await self._send_and_wait(subscribe_msg)
+        if data is not None and data.get("success"):
+            self._subscriptions[msg_id] = event_type or "*"
+            logger.info("Subscribed to events: %s (id=%d)", event_type or "all", msg_id)
+            return msg_id
 
+        logger.error("Subscription failed: %s", data)
         return None
 
+    async def _send_and_wait(self, message: dict[str, Any]) -> dict[str, Any] | None:
+        """Send a message and wait for the listen loop to deliver its result.
+
+        Args:
+            message: The message to send, including its "id".
+
+        Returns:
+            The result message, or None if sending failed, timed out or the
+            connection closed first.
+        """
+        if not self._ws or self._ws.closed:
+            logger.error("WebSocket not connected")
+            return None
+
+        msg_id = message["id"]
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._pending[msg_id] = future
+        try:
+            # HA only accepts text frames, so send the orjson output as str
+            await self._ws.send_str(orjson.dumps(message).decode())
+            async with asyncio.timeout(COMMAND_TIMEOUT):
+                return await future
+        except TimeoutError:
+            logger.error("Command timed out: %s", message.get("type"))
+            return None
+        except (aiohttp.ClientError, ConnectionError) as e:
+            logger.error("Command failed: %s", e)
+            return None
+        finally:
+            self._pending.pop(msg_id, None)
+
     def on_event(self, event_type: str, handler: EventHandler) -> None:
         """Register an event handler.
 
@@ -163,21 +199,38 @@ class HomeAssistantWebSocket:
             event_type: Event type to handle (e.g., "telegram_text").
             handler: Async function to call when event is received.
         """
-        if event_type not in self._handlers:
-            self._handlers[event_type] = []
         self._handlers[event_type].append(handler)
+        self._dispatch_cache.clear()
         logger.debug("Registered handler for event: %s", event_type)
 
     async def _dispatch_event(self, event: Event) -> None:
         """Dispatch an event to registered handlers."""
-        handlers = self._handlers.get(event.event_type, [])
-        handlers.extend(self._handlers.get("*", []))  # Catch-all handlers
-
-        for handler in handlers:
-            try:
-                await handler(event)
-            except Exception as e:
-                logger.exception("Error in event handler for %s: %s", event.event_type, e)
+        handlers = self._dispatch_cache.get(event.event_type)
+        if handlers is None:
+            handlers = (
+                *self._handlers.get(event.event_type, ()),
+                *self._handlers.get("*", ()),  # Catch-all handlers
+            )
+            self._dispatch_cache[event.event_type] = handlers
+
+        # Run handlers concurrently so a slow one doesn't delay the others.
+        # Cancelling this task still raises out of gather; only the handlers'
+        # own outcomes, including self-cancellation, come back as results.
+        results = await asyncio.gather(
+            *(handler(event) for handler in handlers), return_exceptions=True
+        )
+        for handler, result in zip(handlers, results, strict=True):
+            # BaseException too: a handler ending in CancelledError must not vanish
+            if isinstance(result, BaseException):
+                # Full tracebacks only at DEBUG; a flaky handler can fail on every event
+                logger.error(
+                    "Error in event handler %s for %s: %s: %s",
+                    getattr(handler, "__qualname__", handler),
+                    event.event_type,
+                    type(result).__name__,
+                    result,
+                    exc_info=result if logger.isEnabledFor(logging.DEBUG) else None,
+                )
 
     async def _listen_loop(self) -> None:
         """Main loop for receiving messages."""
@@ -187,16 +240,16 @@ class HomeAssistantWebSocket:
         try:
             async for msg in self._ws:
                 if msg.type == aiohttp.WSMsgType.TEXT:
-                    data = json.loads(msg.data)
-
-                    if data.get("type") == "event":
-                        event_data = data.get("event", {})
-                        event = Event.from_dict(event_data)
-                        await self._dispatch_event(event)
+                    data = orjson.loads(msg.data)
 
-                    elif data.get("type") == "result":
-                        # Handle command results if needed
-                        pass
+                    match data.get("type"):
+                        case "event":
+                            # Handlers run in _event_worker so slow ones don't stall reads
+                            await self._event_queue.put(data.get("event", {}))
+                        case "result":
+                            future = self._pending.pop(data.get("id"), None)
+                            if future is not None and not future.done():
+                                future.set_result(data)
 
                 elif msg.type == aiohttp.WSMsgType.ERROR:
                     logger.error("WebSocket error: %s", msg.data)
@@ -211,20 +264,48 @@ class HomeAssistantWebSocket:
             raise
         except Exception as e:
             logger.exception("Error in WebSocket listen loop: %s", e)
+        finally:
+            # Nothing else will answer commands sent on this connection
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("WebSocket connection closed"))
+            self._pending.clear()
+
+    async def _event_worker(self) -> None:
+        """Dispatch events queued by the listen loop."""
+        while True:
+            event_data = await self._event_queue.get()
+            try:
+                await self._dispatch_event(Event.from_dict(event_data))
+            except Exception as e:
+                logger.exception("Error dispatching event: %s", e)
 
     async def run(self) -> None:
         """Run the WebSocket client with automatic reconnection."""
         self._running = True
-
+        worker = asyncio.create_task(self._event_worker())
+        try:
+            await self._run_connection_loop()
+        finally:
+            worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await worker
+
+    async def _run_connection_loop(self) -> None:
+        """Connect, subscribe and listen until stopped, reconnecting with backoff."""
         while self._running:
             try:
                 if await self.connect():
-                    # Subscribe to Telegram events
-                    await self.subscribe_events("telegram_text")
-                    await self.subscribe_events("telegram_command")
+                    # The listen loop delivers subscription results, so start it first
+                    listener = asyncio.create_task(self._listen_loop())
+                    try:
+                        # Subscribe to Telegram events
+                        await self.subscribe_events("telegram_text")
+                        await self.subscribe_events("telegram_command")
 
-                    # Run the listen loop
-                    await self._listen_loop()
+                        await listener
+                    finally:
+                        listener.cancel()
 
                 if not self._running:
                     break
@@ -255,34 +336,17 @@ class HomeAssistantWebSocket:
         Returns:
             The result data, or None if failed.
         """
-        if not self._ws or self._ws.closed:
-            logger.error("WebSocket not connected")
-            return None
-
         msg_id = self._next_id()
         command = {"id": msg_id, "type": command_type, **kwargs}
 
-        await self._ws.send_json(command)
-
-        # Wait for result (with timeout)
-        try:
-            async with asyncio.timeout(30):
-                async for msg in self._ws:
-                    if msg.type != aiohttp.WSMsgType.TEXT:
-                        continue
-
-                    data = json.loads(msg.data)
-                    if data.get("id") == msg_id:
-                        if data.get("success"):
-                            result: dict[str, Any] | None = data.get("result")
-                            return result
-                        else:
-                            logger.error("Command failed: %s", data.get("error"))
-                            return None
-        except TimeoutError:
-            logger.error("Command timed out")
+        data = await self._send_and_wait(command)
+        if data is None:
             return None
+        if data.get("success"):
+            result: dict[str, Any] | None = data.get("result")
+            return result
 
+        logger.error("Command failed: %s", data.get("error"))
         return None
 
     async def call_service(
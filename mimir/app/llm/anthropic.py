@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import logging
 from typing import TYPE_CHECKING, Any
 
+import orjson
 from anthropic import AsyncAnthropic
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
 
 from ..utils.logging import get_logger
-from .base import LLMProvider
+from .base import LLMProvider, MessageCache
 from .types import (
     Message,
     Response,
@@ -25,6 +27,19 @@ from .types import (
 
 logger = get_logger(__name__)
 
+# Streamed text deltas are coalesced until this many characters are buffered
+# or the oldest buffered delta is this many seconds old
+STREAM_TEXT_BATCH_CHARS = 256
+STREAM_TEXT_BATCH_SECONDS = 0.015
+
+# Anthropic stop_reason -> internal StopReason
+STOP_REASON_MAP: dict[str, StopReason] = {
+    "end_turn": StopReason.END_TURN,
+    "tool_use": StopReason.TOOL_USE,
+    "max_tokens": StopReason.MAX_TOKENS,
+    "stop_sequence": StopReason.STOP_SEQUENCE,
+}
+
 
 class AnthropicProvider(LLMProvider):
     """Anthropic Claude LLM provider."""
@@ -48,6 +63,13 @@ class AnthropicProvider(LLMProvider):
         self._model = model
         self._max_tokens = max_tokens
         self._temperature = temperature
+        self._role_converters = {
+            Role.USER: self._convert_user,
+            Role.ASSISTANT: self._convert_assistant,
+        }
+        self._message_cache = MessageCache(self._convert_message)
+        # (tools list, converted) for the most recent tools list
+        self._tools_cache: tuple[list[Tool], list[dict[str, Any]]] | None = None
 
     @property
     def name(self) -> str:
@@ -61,49 +83,62 @@ class AnthropicProvider(LLMProvider):
 
     def _convert_messages(self, messages: list[Message]) -> list[dict[str, Any]]:
         """Convert internal messages to Anthropic format."""
-        result: list[dict[str, Any]] = []
-
-        for msg in messages:
-            if msg.role == Role.USER:
-                if isinstance(msg.content, str):
-                    result.append({"role": "user", "content": msg.content})
-                else:
-                    # Handle tool results
-                    tool_result_blocks: list[dict[str, Any]] = []
-                    for block in msg.content:
-                        if block.type == "tool_result" and block.tool_result:
-                            tool_result_blocks.append(
-                                {
-                                    "type": "tool_result",
-                                    "tool_use_id": block.tool_result.tool_call_id,
-                                    "content": block.tool_result.content,
-                                    "is_error": block.tool_result.is_error,
-                                }
-                            )
-                    result.append({"role": "user", "content": tool_result_blocks})
-
-            elif msg.role == Role.ASSISTANT:
-                assistant_blocks: list[dict[str, Any]] = []
-
-                # Add text content if present
-                if msg.content and isinstance(msg.content, str):
-                    assistant_blocks.append({"type": "text", "text": msg.content})
-
-                # Add tool use blocks
-                if msg.tool_calls:
-                    for tool_call in msg.tool_calls:
-                        assistant_blocks.append(
-                            {
-                                "type": "tool_use",
-                                "id": tool_call.id,
-                                "name": tool_call.name,
-                                "input": tool_call.arguments,
-                            }
-                        )
+        return self._message_cache.convert(messages)
+
+    def _convert_message(self, msg: Message) -> dict[str, Any] | None:
+        """Convert a single internal message to Anthropic format."""
+        converter = self._role_converters.get(msg.role)
+        return converter(msg) if converter else None
+
+    def _convert_user(self, msg: Message) -> dict[str, Any] | None:
+        """Convert a user message (plain text or tool results)."""
+        if isinstance(msg.content, str):
+            return {"role": "user", "content": msg.content}
+
+        # Handle tool results
+        tool_result_blocks: list[dict[str, Any]] = []
+        for block in msg.content:
+            if block.type == "tool_result" and block.tool_result:
+                tool_result_blocks.append(
+                    {
+                        "type": "tool_result",
+                        "tool_use_id": block.tool_result.tool_call_id,
+                        "content": block.tool_result.content,
+                        "is_error": block.tool_result.is_error,
+                    }
+                )
+        return {"role": "user", "content": tool_result_blocks}
+
+    def _convert_assistant(self, msg: Message) -> dict[str, Any] | None:
+        """Convert an assistant message (text and tool calls)."""
+        assistant_blocks: list[dict[str, Any]] = []
+
+        # Add text content if present
+        if msg.content and isinstance(msg.content, str):
+            assistant_blocks.append({"type": "text", "text": msg.content})
+
+        # Add tool use blocks
+        if msg.tool_calls:
+            for tool_call in msg.tool_calls:
+                assistant_blocks.append(
+                    {
+                        "type": "tool_use",
+                        "id": tool_call.id,
+                        "name": tool_call.name,
+                        "input": tool_call.arguments,
+                    }
+                )
 
-                result.append({"role": "assistant", "content": assistant_blocks})
+        return {"role": "assistant", "content": assistant_blocks}
 
-        return result
+    def _get_tools(self, tools: list[Tool]) -> list[dict[str, Any]]:
+        """Convert tools, reusing the result while the same list is passed.
+
+        The tool registry hands out one list until its tools change.
+        """
+        if self._tools_cache is None or self._tools_cache[0] is not tools:
+            self._tools_cache = (tools, self._convert_tools(tools))
+        return self._tools_cache[1]
 
     def _convert_tools(self, tools: list[Tool]) -> list[dict[str, Any]]:
         """Convert internal tools to Anthropic format."""
@@ -126,14 +161,7 @@ class AnthropicProvider(LLMProvider):
                     )
                 )
 
-        # Map stop reason
-        stop_reason_map = {
-            "end_turn": StopReason.END_TURN,
-            "tool_use": StopReason.TOOL_USE,
-            "max_tokens": StopReason.MAX_TOKENS,
-            "stop_sequence": StopReason.STOP_SEQUENCE,
-        }
-        stop_reason = stop_reason_map.get(response.stop_reason, StopReason.END_TURN)
+        stop_reason = STOP_REASON_MAP.get(response.stop_reason, StopReason.END_TURN)
 
         return Response(
             content=content,
@@ -170,18 +198,19 @@ class AnthropicProvider(LLMProvider):
             kwargs["system"] = system
 
         if tools:
-            kwargs["tools"] = self._convert_tools(tools)
+            kwargs["tools"] = self._get_tools(tools)
 
         logger.debug("Sending request to Anthropic: %d messages", len(messages))
 
         response = await self._client.messages.create(**kwargs)
 
-        logger.debug(
-            "Received response: %s, tokens: %d/%d",
-            response.stop_reason,
-            response.usage.input_tokens,
-            response.usage.output_tokens,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Received response: %s, tokens: %d/%d",
+                response.stop_reason,
+                response.usage.input_tokens,
+                response.usage.output_tokens,
+            )
 
         return self._parse_response(response)
 
@@ -209,50 +238,97 @@ class AnthropicProvider(LLMProvider):
             kwargs["system"] = system
 
         if tools:
-            kwargs["tools"] = self._convert_tools(tools)
+            kwargs["tools"] = self._get_tools(tools)
 
         logger.debug("Starting stream from Anthropic: %d messages", len(messages))
 
-        async with self._client.messages.stream(**kwargs) as stream:
-            current_tool_call: dict[str, Any] | None = None
-            accumulated_json = ""
-
-            async for event in stream:
-                if event.type == "content_block_start":
+        current_tool_call: dict[str, Any] | None = None
+        # Argument JSON arrives in fragments; join once when the block ends
+        json_parts: list[str] = []
+        text_parts: list[str] = []
+        text_len = 0
+        text_since = 0.0
+        loop = asyncio.get_running_loop()
+        # State for the final Response
+        content_parts: list[str] = []
+        tool_calls: list[ToolCall] = []
+        model = self._model
+        stop_reason: str | None = None
+        input_tokens = 0
+        output_tokens = 0
+
+        # Raw events rather than messages.stream(): the final Response is built
+        # here, so the SDK's own message accumulator would be a second copy.
+        # Leaving the block releases the HTTP response even when the consumer
+        # stops early or is cancelled.
+        async with await self._client.messages.create(stream=True, **kwargs) as events:
+            async for event in events:
+                if event.type == "message_start":
+                    model = event.message.model
+                    input_tokens = event.message.usage.input_tokens
+                    output_tokens = event.message.usage.output_tokens
+
+                elif event.type == "content_block_start":
                     if event.content_block.type == "tool_use":
                         current_tool_call = {
                             "id": event.content_block.id,
                             "name": event.content_block.name,
                         }
-                        accumulated_json = ""
+                        json_parts.clear()
 
                 elif event.type == "content_block_delta":
                     if event.delta.type == "text_delta":
-                        yield ResponseChunk(delta_content=event.delta.text)
+                        if not text_parts:
+                            text_since = loop.time()
+                        text_parts.append(event.delta.text)
+                        content_parts.append(event.delta.text)
+                        text_len += len(event.delta.text)
+                        if (
+                            text_len >= STREAM_TEXT_BATCH_CHARS
+                            or loop.time() - text_since >= STREAM_TEXT_BATCH_SECONDS
+                        ):
+                            yield ResponseChunk(delta_content="".join(text_parts))
+                            text_parts.clear()
+                            text_len = 0
                     elif event.delta.type == "input_json_delta":
-                        accumulated_json += event.delta.partial_json
+                        json_parts.append(event.delta.partial_json)
 
                 elif event.type == "content_block_stop":
+                    if text_parts:
+                        yield ResponseChunk(delta_content="".join(text_parts))
+                        text_parts.clear()
+                        text_len = 0
+
                     if current_tool_call:
+                        accumulated_json = "".join(json_parts)
                         try:
-                            arguments = json.loads(accumulated_json) if accumulated_json else {}
-                        except json.JSONDecodeError:
+                            arguments = orjson.loads(accumulated_json) if accumulated_json else {}
+                        except orjson.JSONDecodeError:
                             arguments = {}
 
-                        yield ResponseChunk(
-                            delta_tool_call=ToolCall(
-                                id=current_tool_call["id"],
-                                name=current_tool_call["name"],
-                                arguments=arguments,
-                            )
+                        tool_call = ToolCall(
+                            id=current_tool_call["id"],
+                            name=current_tool_call["name"],
+                            arguments=arguments,
                         )
+                        tool_calls.append(tool_call)
+                        yield ResponseChunk(delta_tool_call=tool_call)
                         current_tool_call = None
 
+                elif event.type == "message_delta":
+                    stop_reason = event.delta.stop_reason
+                    output_tokens = event.usage.output_tokens
+
                 elif event.type == "message_stop":
-                    final_message = await stream.get_final_message()
                     yield ResponseChunk(
                         is_final=True,
-                        response=self._parse_response(final_message),
+                        response=Response(
+                            content="".join(content_parts) if content_parts else None,
+                            tool_calls=tool_calls if tool_calls else None,
+                            stop_reason=STOP_REASON_MAP.get(stop_reason or "", StopReason.END_TURN),
+                            usage=Usage(input_tokens=input_tokens, output_tokens=output_tokens),
+                            model=model,
+                        ),
                     )
 
     async def close(self) -> None:
@@ -2,13 +2,64 @@
 
 from __future__ import annotations
 
+import asyncio
+import weakref
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Generic, TypeVar
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator
+    from collections.abc import AsyncGenerator, Callable
 
-    from .types import Message, Response, ResponseChunk, Tool
+    from .types import CompletionRequest, Message, Response, ResponseChunk, Tool
+
+T = TypeVar("T")
+
+# Default cap on concurrent requests in LLMProvider.complete_many()
+COMPLETE_MANY_CONCURRENCY = 16
+
+
+class MessageCache(Generic[T]):
+    """Cache of provider-format messages, keyed by message identity.
+
+    Conversation history is resent on every turn, but messages are never
+    modified once appended, so each one only needs converting once. Entries
+    are dropped when the message is garbage collected.
+    """
+
+    def __init__(self, convert: Callable[[Message], T | None]) -> None:
+        """Initialize the cache.
+
+        Args:
+            convert: Converts one message, or returns None to skip it.
+        """
+        self._convert = convert
+        self._converted: dict[int, T | None] = {}
+
+    def convert(self, messages: list[Message]) -> list[T]:
+        """Convert messages, reusing earlier conversions.
+
+        Args:
+            messages: The conversation history.
+
+        Returns:
+            The converted messages, without skipped ones.
+        """
+        converted = self._converted
+        result: list[T] = []
+        for msg in messages:
+            key = id(msg)
+            if key in converted:
+                item = converted[key]
+            else:
+                item = converted[key] = self._convert(msg)
+                weakref.finalize(msg, converted.pop, key, None)
+            if item is not None:
+                result.append(item)
+        return result
+
+    def __len__(self) -> int:
+        """Return the number of cached messages."""
+        return len(self._converted)
 
 
 class LLMProvider(ABC):
@@ -76,6 +127,31 @@ class LLMProvider(ABC):
         """
         ...
 
+    async def complete_many(
+        self,
+        requests: list[CompletionRequest],
+        max_concurrency: int = COMPLETE_MANY_CONCURRENCY,
+    ) -> list[Response]:
+        """Run several independent completions concurrently.
+
+        Requests overlap on the provider's pooled client, so a batch takes
+        roughly as long as its slowest request rather than the sum of all.
+
+        Args:
+            requests: Keyword arguments for each complete() call.
+            max_concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            The responses, in the same order as requests.
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def complete_one(request: CompletionRequest) -> Response:
+            async with sem:
+                return await self.complete(**request)
+
+        return await asyncio.gather(*(complete_one(r) for r in requests))
+
     async def close(self) -> None:
         """Close any open connections.
 
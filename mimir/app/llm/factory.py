@@ -7,9 +7,10 @@ from typing import TYPE_CHECKING
 from ..config import LLMConfig
 from ..config import LLMProvider as LLMProviderEnum
 from ..utils.logging import get_logger
-from .anthropic import AnthropicProvider
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from .base import LLMProvider
 
 logger = get_logger(__name__)
@@ -21,6 +22,87 @@ class UnsupportedProviderError(Exception):
     pass
 
 
+def _build_anthropic(config: LLMConfig) -> LLMProvider:
+    from .anthropic import AnthropicProvider
+
+    return AnthropicProvider(
+        api_key=config.api_key.get_secret_value(),
+        model=config.model,
+        max_tokens=config.max_tokens,
+        temperature=config.temperature,
+    )
+
+
+def _build_openai(config: LLMConfig) -> LLMProvider:
+    from .openai import OpenAIProvider
+
+    return OpenAIProvider(
+        api_key=config.api_key.get_secret_value(),
+        model=config.model,
+        max_tokens=config.max_tokens,
+        temperature=config.temperature,
+        base_url=config.base_url,
+    )
+
+
+def _build_gemini(config: LLMConfig) -> LLMProvider:
+    from .gemini import GeminiProvider
+
+    return GeminiProvider(
+        api_key=config.api_key.get_secret_value(),
+        model=config.model,
+        max_tokens=config.max_tokens,
+        temperature=config.temperature,
+    )
+
+
+def _build_azure(config: LLMConfig) -> LLMProvider:
+    # Azure uses the OpenAI provider with a custom base URL
+    if not config.base_url:
+        raise UnsupportedProviderError(
+            "Azure provider requires base_url to be set to your Azure OpenAI endpoint."
+        )
+    return _build_openai(config)
+
+
+def _build_ollama(config: LLMConfig) -> LLMProvider:
+    from .local import OllamaProvider
+
+    # Default to localhost if no base_url provided
+    base_url = config.base_url or "http://localhost:11434/v1"
+    return OllamaProvider(
+        model=config.model,
+        base_url=base_url,
+        max_tokens=config.max_tokens,
+        temperature=config.temperature,
+    )
+
+
+def _build_vllm(config: LLMConfig) -> LLMProvider:
+    from .local import VLLMProvider
+
+    # Default to localhost if no base_url provided
+    base_url = config.base_url or "http://localhost:8000/v1"
+    return VLLMProvider(
+        model=config.model,
+        base_url=base_url,
+        api_key=config.api_key.get_secret_value() if config.api_key else "EMPTY",
+        max_tokens=config.max_tokens,
+        temperature=config.temperature,
+    )
+
+
+# Provider -> builder; each SDK is only imported when its provider is built
+PROVIDER_BUILDERS: dict[LLMProviderEnum, Callable[[LLMConfig], LLMProvider]] = {
+    LLMProviderEnum.ANTHROPIC: _build_anthropic,
+    LLMProviderEnum.OPENAI: _build_openai,
+    LLMProviderEnum.GEMINI: _build_gemini,
+    LLMProviderEnum.AZURE: _build_azure,
+    LLMProviderEnum.OLLAMA: _build_ollama,
+    LLMProviderEnum.VLLM: _build_vllm,
+}
+
+
 def create_provider(config: LLMConfig) -> LLMProvider:
     """Create an LLM provider based on configuration.
 
@@ -35,76 +117,7 @@ def create_provider(config: LLMConfig) -> LLMProvider:
     """
     logger.info("Creating LLM provider: %s (model: %s)", config.provider.value, config.model)
 
-    match config.provider:
-        case LLMProviderEnum.ANTHROPIC:
-            return AnthropicProvider(
-                api_key=config.api_key.get_secret_value(),
-                model=config.model,
-                max_tokens=config.max_tokens,
-                temperature=config.temperature,
-            )
-
-        case LLMProviderEnum.OPENAI:
-            from .openai import OpenAIProvider
-
-            return OpenAIProvider(
-                api_key=config.api_key.get_secret_value(),
-                model=config.model,
-                max_tokens=config.max_tokens,
-                temperature=config.temperature,
-                base_url=config.base_url,
-            )
-
-        case LLMProviderEnum.GEMINI:
-            from .gemini import GeminiProvider
-
-            return GeminiProvider(
-                api_key=config.api_key.get_secret_value(),
-                model=config.model,
-                max_tokens=config.max_tokens,
-                temperature=config.temperature,
-            )
-
-        case LLMProviderEnum.AZURE:
-            from .openai import OpenAIProvider
-
-            # Azure uses the OpenAI provider with a custom base URL
-            if not config.base_url:
-                raise UnsupportedProviderError(
-                    "Azure provider requires base_url to be set to your Azure OpenAI endpoint."
-                )
-            return OpenAIProvider(
-                api_key=config.api_key.get_secret_value(),
-                model=config.model,
-                max_tokens=config.max_tokens,
-                temperature=config.temperature,
-                base_url=config.base_url,
-            )
-
-        case LLMProviderEnum.OLLAMA:
-            from .local import OllamaProvider
-
-            # Default to localhost if no base_url provided
-            base_url = config.base_url or "http://localhost:11434/v1"
-            return OllamaProvider(
-                model=config.model,
-                base_url=base_url,
-                max_tokens=config.max_tokens,
-                temperature=config.temperature,
-            )
-
-        case LLMProviderEnum.VLLM:
-            from .local import VLLMProvider
-
-            # Default to localhost if no base_url provided
-            base_url = config.base_url or "http://localhost:8000/v1"
-            return VLLMProvider(
-                model=config.model,
-                base_url=base_url,
-                api_key=config.api_key.get_secret_value() if config.api_key else "EMPTY",
-                max_tokens=config.max_tokens,
-                temperature=config.temperature,
-            )
-
-        case _:
-            raise UnsupportedProviderError(f"Unknown provider: {config.provider}")
+    builder = PROVIDER_BUILDERS.get(config.provider)
+    if builder is None:
+        raise UnsupportedProviderError(f"Unknown provider: {config.provider}")
+    return builder(config)
@@ -10,8 +10,10 @@ from google.generativeai.types import GenerationConfig
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
 
+    from google.generativeai.generative_models import GenerativeModel
+
 from ..utils.logging import get_logger
-from .base import LLMProvider
+from .base import LLMProvider, MessageCache
 from .types import (
     Message,
     Response,
@@ -25,6 +27,15 @@ from .types import (
 
 logger = get_logger(__name__)
 
+# Gemini finish_reason enum value -> internal StopReason
+FINISH_REASON_MAP: dict[int, StopReason] = {
+    1: StopReason.END_TURN,  # STOP
+    2: StopReason.MAX_TOKENS,  # MAX_TOKENS
+}
+
+# GenerativeModel instances kept per distinct system instruction
+MODEL_CACHE_SIZE = 8
+
 
 class GeminiProvider(LLMProvider):
     """Google Gemini LLM provider."""
@@ -49,6 +60,15 @@ class GeminiProvider(LLMProvider):
         self._max_tokens = max_tokens
         self._temperature = temperature
         self._model = genai.GenerativeModel(model)
+        # system instruction -> model, least recently used first
+        self._model_by_system: dict[str, GenerativeModel] = {}
+        self._role_converters = {
+            Role.USER: self._convert_user,
+            Role.ASSISTANT: self._convert_assistant,
+        }
+        self._message_cache = MessageCache(self._convert_message)
+        # (tools list, converted) for the most recent tools list
+        self._tools_cache: tuple[list[Tool], list[dict[str, Any]]] | None = None
 
     @property
     def name(self) -> str:
@@ -60,6 +80,23 @@ class GeminiProvider(LLMProvider):
         """Return the current model name."""
         return self._model_name
 
+    def _get_model(self, system_instruction: str | None) -> GenerativeModel:
+        """Get a model for the system instruction, reusing recent instances."""
+        if not system_instruction:
+            return self._model
+
+        model = self._model_by_system.pop(system_instruction, None)
+        if model is None:
+            model = genai.GenerativeModel(
+                self._model_name,
+                system_instruction=system_instruction,
+            )
+            if len(self._model_by_system) >= MODEL_CACHE_SIZE:
+                del self._model_by_system[next(iter(self._model_by_system))]
+        # Reinsert so the most recently used instruction is evicted last
+        self._model_by_system[system_instruction] = model
+        return model
+
     def _convert_messages(
         self, messages: list[Message], system: str | None = None
     ) -> tuple[list[dict[str, Any]], str | None]:
@@ -68,51 +105,62 @@ class GeminiProvider(LLMProvider):
         Returns:
             Tuple of (messages, system_instruction).
         """
-        result: list[dict[str, Any]] = []
-
-        for msg in messages:
-            if msg.role == Role.USER:
-                if isinstance(msg.content, str):
-                    result.append({"role": "user", "parts": [msg.content]})
-                else:
-                    # Handle tool results
-                    user_parts: list[Any] = []
-                    for block in msg.content:
-                        if block.type == "tool_result" and block.tool_result:
-                            user_parts.append(
-                                {
-                                    "function_response": {
-                                        "name": block.tool_result.tool_call_id,
-                                        "response": {"result": block.tool_result.content},
-                                    }
-                                }
-                            )
-                    if user_parts:
-                        result.append({"role": "user", "parts": user_parts})
-
-            elif msg.role == Role.ASSISTANT:
-                assistant_parts: list[Any] = []
-
-                # Add content if present
-                if msg.content and isinstance(msg.content, str):
-                    assistant_parts.append(msg.content)
-
-                # Add tool calls if present
-                if msg.tool_calls:
-                    for tc in msg.tool_calls:
-                        assistant_parts.append(
-                            {
-                                "function_call": {
-                                    "name": tc.name,
-                                    "args": tc.arguments,
-                                }
-                            }
-                        )
-
-                if assistant_parts:
-                    result.append({"role": "model", "parts": assistant_parts})
-
-        return result, system
+        return self._message_cache.convert(messages), system
+
+    def _convert_message(self, msg: Message) -> dict[str, Any] | None:
+        """Convert a single internal message to Gemini format."""
+        converter = self._role_converters.get(msg.role)
+        return converter(msg) if converter else None
+
+    def _convert_user(self, msg: Message) -> dict[str, Any] | None:
+        """Convert a user message (plain text or tool results)."""
+        if isinstance(msg.content, str):
+            return {"role": "user", "parts": [msg.content]}
+
+        # Handle tool results
+        user_parts: list[Any] = []
+        for block in msg.content:
+            if block.type == "tool_result" and block.tool_result:
+                user_parts.append(
+                    {
+                        "function_response": {
+                            "name": block.tool_result.tool_call_id,
+                            "response": {"result": block.tool_result.content},
+                        }
+                    }
+                )
+        return {"role": "user", "parts": user_parts} if user_parts else None
+
+    def _convert_assistant(self, msg: Message) -> dict[str, Any] | None:
+        """Convert an assistant message (text and tool calls)."""
+        assistant_parts: list[Any] = []
+
+        # Add content if present
+        if msg.content and isinstance(msg.content, str):
+            assistant_parts.append(msg.content)
+
+        # Add tool calls if present
+        if msg.tool_calls:
+            for tc in msg.tool_calls:
+                assistant_parts.append(
+                    {
+                        "function_call": {
+                            "name": tc.name,
+                            "args": tc.arguments,
+                        }
+                    }
+                )
+
+        return {"role": "model", "parts": assistant_parts} if assistant_parts else None
+
+    def _get_tools(self, tools: list[Tool]) -> list[dict[str, Any]]:
+        """Convert tools, reusing the result while the same list is passed.
+
+        The tool registry hands out one list until its tools change.
+        """
+        if self._tools_cache is None or self._tools_cache[0] is not tools:
+            self._tools_cache = (tools, self._convert_tools(tools))
+        return self._tools_cache[1]
 
     def _convert_tools(self, tools: list[Tool]) -> list[dict[str, Any]]:
         """Convert internal tools to Gemini function declarations."""
@@ -133,14 +181,18 @@ class GeminiProvider(LLMProvider):
         candidate = response.candidates[0]
         content_parts = candidate.content.parts
 
-        content = None
+        text_parts: list[str] = []
         tool_calls = []
 
         for part in content_parts:
-            if hasattr(part, "text") and part.text:
-                content = (content or "") + part.text
-            elif hasattr(part, "function_call"):
-                fc = part.function_call
+            text = getattr(part, "text", None)
+            if text:
+                text_parts.append(text)
+                continue
+
+            # An unset proto field is falsy, so text parts don't become calls
+            fc = getattr(part, "function_call", None)
+            if fc:
                 tool_calls.append(
                     ToolCall(
                         id=fc.name,  # Gemini uses function name as ID
@@ -153,12 +205,8 @@ class GeminiProvider(LLMProvider):
         finish_reason = candidate.finish_reason
         if tool_calls:
             stop_reason = StopReason.TOOL_USE
-        elif finish_reason == 1:  # STOP
-            stop_reason = StopReason.END_TURN
-        elif finish_reason == 2:  # MAX_TOKENS
-            stop_reason = StopReason.MAX_TOKENS
         else:
-            stop_reason = StopReason.END_TURN
+            stop_reason = FINISH_REASON_MAP.get(finish_reason, StopReason.END_TURN)
 
         # Get usage if available
         usage_metadata = getattr(response, "usage_metadata", None)
@@ -171,7 +219,7 @@ class GeminiProvider(LLMProvider):
             usage = Usage(input_tokens=0, output_tokens=0)
 
         return Response(
-            content=content,
+            content="".join(text_parts) if text_parts else None,
             tool_calls=tool_calls if tool_calls else None,
             stop_reason=stop_reason,
             usage=usage,
@@ -194,34 +242,16 @@ class GeminiProvider(LLMProvider):
             temperature=temperature if temperature is not None else self._temperature,
         )
 
-        # Create model with system instruction if provided
-        if system_instruction:
-            model = genai.GenerativeModel(
-                self._model_name,
-                system_instruction=system_instruction,
-            )
-        else:
-            model = self._model
-
-        kwargs: dict[str, Any] = {
-            "generation_config": generation_config,
-        }
-
-        if tools:
-            kwargs["tools"] = self._convert_tools(tools)
+        model = self._get_model(system_instruction)
 
         logger.debug("Sending request to Gemini: %d messages", len(messages))
 
-        # Convert messages to chat history format
-        chat = model.start_chat(history=gemini_messages[:-1] if gemini_messages else [])
-
-        # Get the last message to send
-        if gemini_messages:
-            last_message = gemini_messages[-1]
-            last_content = last_message.get("parts", [""])
-            response = await chat.send_message_async(last_content, **kwargs)
-        else:
-            response = await chat.send_message_async("Hello", **kwargs)
+        # The whole history goes in one contents list; no ChatSession needed
+        response = await model.generate_content_async(
+            gemini_messages or "Hello",
+            generation_config=generation_config,
+            tools=self._get_tools(tools) if tools else None,
+        )
 
         logger.debug("Received response from Gemini")
 
@@ -243,47 +273,28 @@ class GeminiProvider(LLMProvider):
             temperature=temperature if temperature is not None else self._temperature,
         )
 
-        # Create model with system instruction if provided
-        if system_instruction:
-            model = genai.GenerativeModel(
-                self._model_name,
-                system_instruction=system_instruction,
-            )
-        else:
-            model = self._model
-
-        kwargs: dict[str, Any] = {
-            "generation_config": generation_config,
-            "stream": True,
-        }
-
-        if tools:
-            kwargs["tools"] = self._convert_tools(tools)
+        model = self._get_model(system_instruction)
 
         logger.debug("Starting stream from Gemini: %d messages", len(messages))
 
-        # Convert messages to chat history format
-        chat = model.start_chat(history=gemini_messages[:-1] if gemini_messages else [])
-
-        # Get the last message to send
-        if gemini_messages:
-            last_message = gemini_messages[-1]
-            last_content = last_message.get("parts", [""])
-        else:
-            last_content = "Hello"
-
-        accumulated_content = ""
+        content_parts: list[str] = []
         tool_calls: list[ToolCall] = []
 
-        async for chunk in await chat.send_message_async(last_content, **kwargs):
+        response = await model.generate_content_async(
+            gemini_messages or "Hello",
+            generation_config=generation_config,
+            tools=self._get_tools(tools) if tools else None,
+            stream=True,
+        )
+        async for chunk in response:
             if chunk.text:
-                accumulated_content += chunk.text
+                content_parts.append(chunk.text)
                 yield ResponseChunk(delta_content=chunk.text)
 
             # Check for function calls in the chunk
             for part in chunk.parts:
-                if hasattr(part, "function_call"):
-                    fc = part.function_call
+                fc = getattr(part, "function_call", None)
+                if fc:
                     tool_call = ToolCall(
                         id=fc.name,
                         name=fc.name,
@@ -299,7 +310,7 @@ class GeminiProvider(LLMProvider):
         yield ResponseChunk(
             is_final=True,
             response=Response(
-                content=accumulated_content if accumulated_content else None,
+                content="".join(content_parts) if content_parts else None,
                 tool_calls=tool_calls if tool_calls else None,
                 stop_reason=stop_reason,
                 usage=Usage(input_tokens=0, output_tokens=0),
@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
-import json
+import logging
 from typing import TYPE_CHECKING, Any
 
+import orjson
 from openai import AsyncOpenAI
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
 
 from ..utils.logging import get_logger
-from .base import LLMProvider
+from .base import LLMProvider, MessageCache
 from .types import (
     Message,
     Response,
@@ -25,9 +26,20 @@ from .types import (
 
 logger = get_logger(__name__)
 
+# OpenAI-style finish_reason -> internal StopReason
+FINISH_REASON_MAP: dict[str, StopReason] = {
+    "stop": StopReason.END_TURN,
+    "tool_calls": StopReason.TOOL_USE,
+    "length": StopReason.MAX_TOKENS,
+}
+
 
 class OpenAIProvider(LLMProvider):
-    """OpenAI GPT LLM provider."""
+    """OpenAI GPT LLM provider.
+
+    Also the implementation behind the OpenAI-compatible local providers,
+    which only change the client setup and provider name.
+    """
 
     def __init__(
         self,
@@ -50,6 +62,19 @@ class OpenAIProvider(LLMProvider):
         self._model = model
         self._max_tokens = max_tokens
         self._temperature = temperature
+        # Arguments shared by every request; copied and overlaid per call
+        self._base_kwargs: dict[str, Any] = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+        self._role_converters = {
+            Role.USER: self._convert_user,
+            Role.ASSISTANT: self._convert_assistant,
+        }
+        self._message_cache = MessageCache(self._convert_message)
+        # (tools list, converted) for the most recent tools list
+        self._tools_cache: tuple[list[Tool], list[dict[str, Any]]] | None = None
 
     @property
     def name(self) -> str:
@@ -65,61 +90,94 @@ class OpenAIProvider(LLMProvider):
         self, messages: list[Message], system: str | None = None
     ) -> list[dict[str, Any]]:
         """Convert internal messages to OpenAI format."""
-        result: list[dict[str, Any]] = []
-
         # Add system message first if provided
-        if system:
-            result.append({"role": "system", "content": system})
-
-        for msg in messages:
-            if msg.role == Role.USER:
-                if isinstance(msg.content, str):
-                    result.append({"role": "user", "content": msg.content})
-                else:
-                    # Handle tool results - OpenAI expects them as separate tool messages
-                    for block in msg.content:
-                        if block.type == "tool_result" and block.tool_result:
-                            result.append(
-                                {
-                                    "role": "tool",
-                                    "tool_call_id": block.tool_result.tool_call_id,
-                                    "content": block.tool_result.content,
-                                }
-                            )
-
-            elif msg.role == Role.ASSISTANT:
-                assistant_msg: dict[str, Any] = {"role": "assistant"}
-
-                # Add content if present
-                if msg.content and isinstance(msg.content, str):
-                    assistant_msg["content"] = msg.content
-                else:
-                    assistant_msg["content"] = None
-
-                # Add tool calls if present
-                if msg.tool_calls:
-                    assistant_msg["tool_calls"] = [
-                        {
-                            "id": tc.id,
-                            "type": "function",
-                            "function": {
-                                "name": tc.name,
-                                "arguments": json.dumps(tc.arguments),
-                            },
-                        }
-                        for tc in msg.tool_calls
-                    ]
+        result: list[dict[str, Any]] = [{"role": "system", "content": system}] if system else []
+        # History messages are converted once and reused on later turns
+        for converted in self._message_cache.convert(messages):
+            result.extend(converted)
+        return result
 
-                result.append(assistant_msg)
+    def _convert_message(self, msg: Message) -> list[dict[str, Any]]:
+        """Convert a single internal message to zero or more OpenAI messages."""
+        converter = self._role_converters.get(msg.role)
+        return converter(msg) if converter else []
+
+    def _convert_user(self, msg: Message) -> list[dict[str, Any]]:
+        """Convert a user message (plain text or tool results)."""
+        if isinstance(msg.content, str):
+            return [{"role": "user", "content": msg.content}]
+
+        # Handle tool results - OpenAI expects them as separate tool messages
+        return [
+            {
+                "role": "tool",
+                "tool_call_id": block.tool_result.tool_call_id,
+                "content": block.tool_result.content,
+            }
+            for block in msg.content
+            if block.type == "tool_result" and block.tool_result
+        ]
+
+    def _convert_assistant(self, msg: Message) -> list[dict[str, Any]]:
+        """Convert an assistant message (text and tool calls)."""
+        assistant_msg: dict[str, Any] = {
+            "role": "assistant",
+            "content": msg.content if msg.content and isinstance(msg.content, str) else None,
+        }
 
-        return result
+        # Add tool calls if present
+        if msg.tool_calls:
+            assistant_msg["tool_calls"] = [
+                {
+                    "id": tc.id,
+                    "type": "function",
+                    "function": {
+                        "name": tc.name,
+                        "arguments": orjson.dumps(tc.arguments).decode(),
+                    },
+                }
+                for tc in msg.tool_calls
+            ]
+
+        return [assistant_msg]
+
+    def _get_tools(self, tools: list[Tool]) -> list[dict[str, Any]]:
+        """Convert tools, reusing the result while the same list is passed.
+
+        The tool registry hands out one list until its tools change.
+        """
+        if self._tools_cache is None or self._tools_cache[0] is not tools:
+            self._tools_cache = (tools, self._convert_tools(tools))
+        return self._tools_cache[1]
 
     def _convert_tools(self, tools: list[Tool]) -> list[dict[str, Any]]:
         """Convert internal tools to OpenAI format."""
         return [tool.to_openai_format() for tool in tools]
 
+    def _request_kwargs(
+        self,
+        messages: list[Message],
+        tools: list[Tool] | None,
+        system: str | None,
+        max_tokens: int | None,
+        temperature: float | None,
+    ) -> dict[str, Any]:
+        """Build chat completion arguments on top of the provider defaults."""
+        kwargs = self._base_kwargs.copy()
+        kwargs["messages"] = self._convert_messages(messages, system)
+
+        if max_tokens:
+            kwargs["max_tokens"] = max_tokens
+        if temperature is not None:
+            kwargs["temperature"] = temperature
+        if tools:
+            kwargs["tools"] = self._get_tools(tools)
+            kwargs["tool_choice"] = "auto"
+
+        return kwargs
+
     def _parse_response(self, response: Any) -> Response:
-        """Parse OpenAI response to internal format."""
+        """Parse a chat completion response to internal format."""
         choice = response.choices[0]
         message = choice.message
 
@@ -129,8 +187,8 @@ class OpenAIProvider(LLMProvider):
         if message.tool_calls:
             for tc in message.tool_calls:
                 try:
-                    arguments = json.loads(tc.function.arguments)
-                except json.JSONDecodeError:
+                    arguments = orjson.loads(tc.function.arguments)
+                except orjson.JSONDecodeError:
                     arguments = {}
 
                 tool_calls.append(
@@ -141,22 +199,21 @@ class OpenAIProvider(LLMProvider):
                     )
                 )
 
-        # Map finish reason
-        finish_reason_map = {
-            "stop": StopReason.END_TURN,
-            "tool_calls": StopReason.TOOL_USE,
-            "length": StopReason.MAX_TOKENS,
-        }
-        stop_reason = finish_reason_map.get(choice.finish_reason, StopReason.END_TURN)
+        stop_reason = FINISH_REASON_MAP.get(choice.finish_reason, StopReason.END_TURN)
+
+        # Local servers may omit usage or its counts
+        usage = Usage(input_tokens=0, output_tokens=0)
+        if response.usage:
+            usage = Usage(
+                input_tokens=response.usage.prompt_tokens or 0,
+                output_tokens=response.usage.completion_tokens or 0,
+            )
 
         return Response(
             content=content,
             tool_calls=tool_calls if tool_calls else None,
             stop_reason=stop_reason,
-            usage=Usage(
-                input_tokens=response.usage.prompt_tokens,
-                output_tokens=response.usage.completion_tokens,
-            ),
+            usage=usage,
             model=response.model,
         )
 
@@ -168,36 +225,22 @@ class OpenAIProvider(LLMProvider):
         max_tokens: int | None = None,
         temperature: float | None = None,
     ) -> Response:
-        """Send a completion request to OpenAI."""
-        openai_messages = self._convert_messages(messages, system)
+        """Send a chat completion request."""
+        kwargs = self._request_kwargs(messages, tools, system, max_tokens, temperature)
 
-        kwargs: dict[str, Any] = {
-            "model": self._model,
-            "messages": openai_messages,
-            "max_tokens": max_tokens or self._max_tokens,
-        }
+        logger.debug("Sending request to %s: %d messages", self.name, len(messages))
 
-        if temperature is not None:
-            kwargs["temperature"] = temperature
-        else:
-            kwargs["temperature"] = self._temperature
+        response = self._parse_response(await self._client.chat.completions.create(**kwargs))
 
-        if tools:
-            kwargs["tools"] = self._convert_tools(tools)
-            kwargs["tool_choice"] = "auto"
-
-        logger.debug("Sending request to OpenAI: %d messages", len(messages))
-
-        response = await self._client.chat.completions.create(**kwargs)
-
-        logger.debug(
-            "Received response: %s, tokens: %d/%d",
-            response.choices[0].finish_reason,
-            response.usage.prompt_tokens,
-            response.usage.completion_tokens,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Received response: %s, tokens: %d/%d",
+                response.stop_reason.value,
+                response.usage.input_tokens,
+                response.usage.output_tokens,
+            )
 
-        return self._parse_response(response)
+        return response
 
     async def stream(
         self,
@@ -207,30 +250,15 @@ class OpenAIProvider(LLMProvider):
         max_tokens: int | None = None,
         temperature: float | None = None,
     ) -> AsyncGenerator[ResponseChunk, None]:
-        """Stream a completion response from OpenAI."""
-        openai_messages = self._convert_messages(messages, system)
-
-        kwargs: dict[str, Any] = {
-            "model": self._model,
-            "messages": openai_messages,
-            "max_tokens": max_tokens or self._max_tokens,
-            "stream": True,
-        }
-
-        if temperature is not None:
-            kwargs["temperature"] = temperature
-        else:
-            kwargs["temperature"] = self._temperature
+        """Stream a chat completion response."""
+        kwargs = self._request_kwargs(messages, tools, system, max_tokens, temperature)
+        kwargs["stream"] = True
 
-        if tools:
-            kwargs["tools"] = self._convert_tools(tools)
-            kwargs["tool_choice"] = "auto"
-
-        logger.debug("Starting stream from OpenAI: %d messages", len(messages))
+        logger.debug("Starting stream from %s: %d messages", self.name, len(messages))
 
         # Track tool calls being accumulated
         current_tool_calls: dict[int, dict[str, Any]] = {}
-        accumulated_content = ""
+        content_parts: list[str] = []
         finish_reason = None
         model_name = self._model
 
@@ -241,16 +269,17 @@ class OpenAIProvider(LLMProvider):
             if not chunk.choices:
                 continue
 
-            delta = chunk.choices[0].delta
-            chunk_finish_reason = chunk.choices[0].finish_reason
+            choice = chunk.choices[0]
+            delta = choice.delta
 
-            if chunk_finish_reason:
-                finish_reason = chunk_finish_reason
+            if choice.finish_reason:
+                finish_reason = choice.finish_reason
 
             # Handle content delta
-            if delta.content:
-                accumulated_content += delta.content
-                yield ResponseChunk(delta_content=delta.content)
+            content = delta.content
+            if content:
+                content_parts.append(content)
+                yield ResponseChunk(delta_content=content)
 
             # Handle tool call deltas
             if delta.tool_calls:
@@ -261,7 +290,8 @@ class OpenAIProvider(LLMProvider):
                         current_tool_calls[idx] = {
                             "id": tc_delta.id or "",
                             "name": "",
-                            "arguments": "",
+                            # Argument fragments; joined once the stream ends
+                            "arguments_parts": [],
                         }
 
                     if tc_delta.id:
@@ -270,15 +300,20 @@ class OpenAIProvider(LLMProvider):
                         if tc_delta.function.name:
                             current_tool_calls[idx]["name"] = tc_delta.function.name
                         if tc_delta.function.arguments:
-                            current_tool_calls[idx]["arguments"] += tc_delta.function.arguments
+                            current_tool_calls[idx]["arguments_parts"].append(
+                                tc_delta.function.arguments
+                            )
 
         # Yield final tool calls
         tool_calls = []
-        for idx in sorted(current_tool_calls.keys()):
-            tc_data = current_tool_calls[idx]
+        # Dicts keep insertion order, which is the order the calls started in
+        for tc_data in current_tool_calls.values():
+            raw_arguments = "".join(tc_data["arguments_parts"]).rstrip()
+            # A buffer that doesn't close its object was cut off; don't try to parse it
+            complete = raw_arguments.endswith(("}", "]"))
             try:
-                arguments = json.loads(tc_data["arguments"]) if tc_data["arguments"] else {}
-            except json.JSONDecodeError:
+                arguments = orjson.loads(raw_arguments) if complete else {}
+            except orjson.JSONDecodeError:
                 arguments = {}
 
             tool_call = ToolCall(
@@ -289,19 +324,13 @@ class OpenAIProvider(LLMProvider):
             tool_calls.append(tool_call)
             yield ResponseChunk(delta_tool_call=tool_call)
 
-        # Map finish reason
-        finish_reason_map = {
-            "stop": StopReason.END_TURN,
-            "tool_calls": StopReason.TOOL_USE,
-            "length": StopReason.MAX_TOKENS,
-        }
-        stop_reason = finish_reason_map.get(finish_reason or "stop", StopReason.END_TURN)
+        stop_reason = FINISH_REASON_MAP.get(finish_reason or "stop", StopReason.END_TURN)
 
         # Yield final response
         yield ResponseChunk(
             is_final=True,
             response=Response(
-                content=accumulated_content if accumulated_content else None,
+                content="".join(content_parts) if content_parts else None,
                 tool_calls=tool_calls if tool_calls else None,
                 stop_reason=stop_reason,
                 usage=Usage(input_tokens=0, output_tokens=0),  # Not available in streaming
@@ -310,5 +339,5 @@ class OpenAIProvider(LLMProvider):
         )
 
     async def close(self) -> None:
-        """Close the OpenAI client."""
+        """Close the API client."""
         await self._client.close()
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from typing import Any, NotRequired, TypedDict
 
 
 class Role(str, Enum):
@@ -15,7 +16,7 @@ class Role(str, Enum):
     TOOL = "tool"
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     """Represents a tool call made by the LLM."""
 
@@ -24,7 +25,7 @@ class ToolCall:
     arguments: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """Represents the result of a tool execution."""
 
@@ -33,7 +34,7 @@ class ToolResult:
     is_error: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentBlock:
     """A content block within a message."""
 
@@ -43,7 +44,8 @@ class ContentBlock:
     tool_result: ToolResult | None = None
 
 
-@dataclass
+# weakref_slot keeps Message weak-referenceable for MessageCache
+@dataclass(slots=True, weakref_slot=True)
 class Message:
     """A message in a conversation."""
 
@@ -88,15 +90,29 @@ class Tool:
     parameters: dict[str, Any]  # JSON Schema
 
     def to_anthropic_format(self) -> dict[str, Any]:
-        """Convert to Anthropic's tool format."""
+        """Convert to Anthropic's tool format.
+
+        Built once per tool and shared between requests; don't mutate it.
+        """
+        return self._anthropic_format
+
+    def to_openai_format(self) -> dict[str, Any]:
+        """Convert to OpenAI's tool format.
+
+        Built once per tool and shared between requests; don't mutate it.
+        """
+        return self._openai_format
+
+    @functools.cached_property
+    def _anthropic_format(self) -> dict[str, Any]:
         return {
             "name": self.name,
             "description": self.description,
             "input_schema": self.parameters,
         }
 
-    def to_openai_format(self) -> dict[str, Any]:
-        """Convert to OpenAI's tool format."""
+    @functools.cached_property
+    def _openai_format(self) -> dict[str, Any]:
         return {
             "type": "function",
             "function": {
@@ -116,7 +132,7 @@ class StopReason(str, Enum):
     STOP_SEQUENCE = "stop_sequence"
 
 
-@dataclass
+@dataclass(slots=True)
 class Usage:
     """Token usage statistics."""
 
@@ -129,7 +145,7 @@ class Usage:
         return self.input_tokens + self.output_tokens
 
 
-@dataclass
+@dataclass(slots=True)
 class Response:
     """Response from an LLM completion."""
 
@@ -145,7 +161,7 @@ class Response:
         return self.tool_calls is not None and len(self.tool_calls) > 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ResponseChunk:
     """A streaming response chunk."""
 
@@ -153,3 +169,13 @@ class ResponseChunk:
     delta_tool_call: ToolCall | None = None
     is_final: bool = False
     response: Response | None = None  # Only set when is_final=True
+
+
+class CompletionRequest(TypedDict):
+    """Arguments for one LLMProvider.complete() call in a batch."""
+
+    messages: list[Message]
+    tools: NotRequired[list[Tool] | None]
+    system: NotRequired[str | None]
+    max_tokens: NotRequired[int | None]
+    temperature: NotRequired[float | None]
@@ -13,7 +13,6 @@ from typing import TYPE_CHECKING, Any
 from aiohttp import web
 
 from .config import OperatingMode, load_config
-from .conversation.manager import ConversationManager
 from .db import AuditRepository, Database, MemoryRepository
 from .git import GitManager
 from .git.manager import GitConfig
@@ -21,53 +20,25 @@ from .ha.api import HomeAssistantAPI
 from .ha.websocket import HomeAssistantWebSocket
 from .llm.factory import create_provider
 from .notifications import NotificationManager
-from .telegram.handler import TelegramHandler
-from .tools.ha_tools import (
-    AssignEntityAreaTool,
-    AssignEntityLabelsTool,
-    CallServiceTool,
-    CreateAutomationTool,
-    CreateHelperTool,
-    CreateSceneTool,
-    CreateScriptTool,
-    DeleteAutomationTool,
-    DeleteHelperTool,
-    DeleteSceneTool,
-    DeleteScriptTool,
-    GetAreasTool,
-    GetAutomationConfigTool,
-    GetAutomationsTool,
-    GetEntitiesTool,
-    GetEntityStateTool,
-    GetErrorLogTool,
-    GetHelpersTool,
-    GetLabelsTool,
-    GetLogbookTool,
-    GetSceneConfigTool,
-    GetScenesTool,
-    GetScriptConfigTool,
-    GetScriptsTool,
-    GetServicesTool,
-    RenameEntityTool,
-    UpdateAutomationTool,
-    UpdateSceneTool,
-    UpdateScriptTool,
-)
 from .tools.memory_tools import ForgetMemoryTool, RecallMemoriesTool, StoreMemoryTool
 from .tools.registry import ToolRegistry
-from .tools.web_search import HACSSearchTool, HomeAssistantDocsSearchTool, WebSearchTool
 from .utils.logging import get_logger, setup_logging
 from .utils.mode_manager import ModeManager
 from .utils.mode_manager import OperatingMode as ModeEnum
 from .web import request_logger_middleware, setup_routes
 
 if TYPE_CHECKING:
+    from .conversation.manager import ConversationManager
     from .ha.types import TelegramMessage
+    from .telegram.handler import TelegramHandler
 
 from .ha.types import UserContext
 
 logger = get_logger(__name__)
 
+# Rule printed around the startup title
+BANNER = "=" * 50
+
 
 class MimirAgent:
     """The main Mímir agent application."""
@@ -122,51 +93,83 @@ class MimirAgent:
 
     def _register_tools(self) -> None:
         """Register available tools."""
-        # Web search tools
-        self._tool_registry.register(WebSearchTool())
-        self._tool_registry.register(HomeAssistantDocsSearchTool())
-        self._tool_registry.register(HACSSearchTool())
-
-        # Home Assistant entity tools
-        self._tool_registry.register(GetEntitiesTool(self._ha_api))
-        self._tool_registry.register(GetEntityStateTool(self._ha_api))
-        self._tool_registry.register(CallServiceTool(self._ha_api))
-        self._tool_registry.register(GetServicesTool(self._ha_api))
-        self._tool_registry.register(GetErrorLogTool(self._ha_api))
-        self._tool_registry.register(GetLogbookTool(self._ha_api))
-
-        # Automation tools
-        self._tool_registry.register(GetAutomationsTool(self._ha_api))
-        self._tool_registry.register(GetAutomationConfigTool(self._ha_api))
-        self._tool_registry.register(CreateAutomationTool(self._ha_api))
-        self._tool_registry.register(UpdateAutomationTool(self._ha_api))
-        self._tool_registry.register(DeleteAutomationTool(self._ha_api))
-
-        # Script tools
-        self._tool_registry.register(GetScriptsTool(self._ha_api))
-        self._tool_registry.register(GetScriptConfigTool(self._ha_api))
-        self._tool_registry.register(CreateScriptTool(self._ha_api))
-        self._tool_registry.register(UpdateScriptTool(self._ha_api))
-        self._tool_registry.register(DeleteScriptTool(self._ha_api))
-
-        # Scene tools
-        self._tool_registry.register(GetScenesTool(self._ha_api))
-        self._tool_registry.register(GetSceneConfigTool(self._ha_api))
-        self._tool_registry.register(CreateSceneTool(self._ha_api))
-        self._tool_registry.register(UpdateSceneTool(self._ha_api))
-        self._tool_registry.register(DeleteSceneTool(self._ha_api))
-
-        # Helper tools
-        self._tool_registry.register(GetHelpersTool(self._ha_api))
-        self._tool_registry.register(CreateHelperTool(self._ha_api))
-        self._tool_registry.register(DeleteHelperTool(self._ha_api))
-
-        # Entity registry tools
-        self._tool_registry.register(RenameEntityTool(self._ha_api))
-        self._tool_registry.register(AssignEntityAreaTool(self._ha_api))
-        self._tool_registry.register(AssignEntityLabelsTool(self._ha_api))
-        self._tool_registry.register(GetAreasTool(self._ha_api))
-        self._tool_registry.register(GetLabelsTool(self._ha_api))
+        # Imported here so importing this module doesn't load every tool
+        from .tools.ha_tools import (
+            AssignEntityAreaTool,
+            AssignEntityLabelsTool,
+            CallServiceTool,
+            CreateAutomationTool,
+            CreateHelperTool,
+            CreateSceneTool,
+            CreateScriptTool,
+            DeleteAutomationTool,
+            DeleteHelperTool,
+            DeleteSceneTool,
+            DeleteScriptTool,
+            GetAreasTool,
+            GetAutomationConfigTool,
+            GetAutomationsTool,
+            GetEntitiesTool,
+            GetEntityStateTool,
+            GetErrorLogTool,
+            GetHelpersTool,
+            GetLabelsTool,
+            GetLogbookTool,
+            GetSceneConfigTool,
+            GetScenesTool,
+            GetScriptConfigTool,
+            GetScriptsTool,
+            GetServicesTool,
+            RenameEntityTool,
+            UpdateAutomationTool,
+            UpdateSceneTool,
+            UpdateScriptTool,
+        )
+        from .tools.web_search import HACSSearchTool, HomeAssistantDocsSearchTool, WebSearchTool
+
+        self._tool_registry.register_many(
+            [
+                # Web search tools
+                WebSearchTool(),
+                HomeAssistantDocsSearchTool(),
+                HACSSearchTool(),
+                # Home Assistant entity tools
+                GetEntitiesTool(self._ha_api),
+                GetEntityStateTool(self._ha_api),
+                CallServiceTool(self._ha_api),
+                GetServicesTool(self._ha_api),
+                GetErrorLogTool(self._ha_api),
+                GetLogbookTool(self._ha_api),
+                # Automation tools
+                GetAutomationsTool(self._ha_api),
+                GetAutomationConfigTool(self._ha_api),
+                CreateAutomationTool(self._ha_api),
+                UpdateAutomationTool(self._ha_api),
+                DeleteAutomationTool(self._ha_api),
+                # Script tools
+                GetScriptsTool(self._ha_api),
+                GetScriptConfigTool(self._ha_api),
+                CreateScriptTool(self._ha_api),
+                UpdateScriptTool(self._ha_api),
+                DeleteScriptTool(self._ha_api),
+                # Scene tools
+                GetScenesTool(self._ha_api),
+                GetSceneConfigTool(self._ha_api),
+                CreateSceneTool(self._ha_api),
+                UpdateSceneTool(self._ha_api),
+                DeleteSceneTool(self._ha_api),
+                # Helper tools
+                GetHelpersTool(self._ha_api),
+                CreateHelperTool(self._ha_api),
+                DeleteHelperTool(self._ha_api),
+                # Entity registry tools
+                RenameEntityTool(self._ha_api),
+                AssignEntityAreaTool(self._ha_api),
+                AssignEntityLabelsTool(self._ha_api),
+                GetAreasTool(self._ha_api),
+                GetLabelsTool(self._ha_api),
+            ]
+        )
 
         logger.info("Registered %d tools", len(self._tool_registry))
 
@@ -229,9 +232,13 @@ class MimirAgent:
         self._memory = MemoryRepository(self._database)
 
         # Register memory tools now that we have the repository
-        self._tool_registry.register(StoreMemoryTool(self._memory))
-        self._tool_registry.register(RecallMemoriesTool(self._memory))
-        self._tool_registry.register(ForgetMemoryTool(self._memory))
+        self._tool_registry.register_many(
+            [
+                StoreMemoryTool(self._memory),
+                RecallMemoriesTool(self._memory),
+                ForgetMemoryTool(self._memory),
+            ]
+        )
 
         logger.info("Database initialized at %s", db_path)
 
@@ -286,7 +293,9 @@ class MimirAgent:
         # Setup all routes
         setup_routes(self._web_app)
 
-        self._web_runner = web.AppRunner(self._web_app)
+        # No access log: the health endpoint is polled constantly, and each
+        # logged request costs a LogRecord and formatter pass
+        self._web_runner = web.AppRunner(self._web_app, access_log=None, shutdown_timeout=2.0)
         await self._web_runner.setup()
 
         site = web.TCPSite(self._web_runner, "0.0.0.0", 5000)
@@ -344,6 +353,10 @@ class MimirAgent:
             await self._stop_web_server()
             return
 
+        # Deferred until HA is reachable; not needed to serve the status page
+        from .conversation.manager import ConversationManager
+        from .telegram.handler import TelegramHandler
+
         # Initialize conversation manager with audit, memory, and mode manager
         # Convert config.OperatingMode to mode_manager.OperatingMode
         operating_mode = ModeEnum(self._config.operating_mode.value)
@@ -455,9 +468,9 @@ async def main() -> None:
     # Setup logging
     setup_logging()
 
-    logger.info("=" * 50)
+    logger.info(BANNER)
     logger.info("Mímir - Intelligent Home Assistant Agent")
-    logger.info("=" * 50)
+    logger.info(BANNER)
 
     # Create and start the agent
     agent = MimirAgent()
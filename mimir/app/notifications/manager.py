@@ -230,7 +230,8 @@ class NotificationManager:
         issues: list[DetectedIssue] = []
 
         try:
-            states = await self.ha_api.get_states()
+            # Only entity_id and state are needed, so skip building EntityState objects
+            states = await self.ha_api.get_states_raw()
         except Exception as e:
             logger.warning("Failed to get states: %s", e)
             return issues
@@ -240,17 +241,18 @@ class NotificationManager:
 
         newly_unavailable = []
         for state in states:
-            domain = state.entity_id.split(".")[0]
+            entity_id = state["entity_id"]
+            domain = entity_id.split(".")[0]
             if domain not in important_domains:
                 continue
 
-            if state.state == "unavailable":
-                if state.entity_id not in self._notified_unavailable:
-                    self._notified_unavailable.add(state.entity_id)
-                    newly_unavailable.append(state.entity_id)
+            if state["state"] == "unavailable":
+                if entity_id not in self._notified_unavailable:
+                    self._notified_unavailable.add(entity_id)
+                    newly_unavailable.append(entity_id)
             else:
                 # Entity is back, remove from notified set
-                self._notified_unavailable.discard(state.entity_id)
+                self._notified_unavailable.discard(entity_id)
 
         if newly_unavailable:
             # Group notifications
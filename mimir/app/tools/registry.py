@@ -11,6 +11,8 @@ from ..utils.mode_manager import ModeManager  # noqa: TC001
 from ..utils.rate_limiter import RateLimiter, get_operation_type
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from ..llm.types import Tool as LLMTool
     from .base import BaseTool
 
@@ -56,6 +58,8 @@ class ToolRegistry:
         self._rate_limiter: RateLimiter | None = None
         self._rate_limiting_enabled: bool = True
         self._mode_manager: ModeManager | None = None
+        # LLM-format tool list, rebuilt after the registered tools change
+        self._llm_tools: list[LLMTool] | None = None
 
     def set_execution_callback(self, callback: ExecutionCallback | None) -> None:
         """Set a callback to be called after each tool execution.
@@ -140,8 +144,28 @@ class ToolRegistry:
             logger.warning("Overwriting existing tool: %s", tool.name)
 
         self._tools[tool.name] = tool
+        self._llm_tools = None
         logger.debug("Registered tool: %s", tool.name)
 
+    def register_many(self, tools: Iterable[BaseTool]) -> None:
+        """Register several tools at once.
+
+        Invalidates the cached LLM tool list once for the whole batch
+        instead of once per tool.
+
+        Args:
+            tools: The tools to register.
+        """
+        count = 0
+        for tool in tools:
+            if tool.name in self._tools:
+                logger.warning("Overwriting existing tool: %s", tool.name)
+            self._tools[tool.name] = tool
+            count += 1
+
+        self._llm_tools = None
+        logger.debug("Registered %d tools", count)
+
     def unregister(self, name: str) -> None:
         """Unregister a tool by name.
 
@@ -150,6 +174,7 @@ class ToolRegistry:
         """
         if name in self._tools:
             del self._tools[name]
+            self._llm_tools = None
             logger.debug("Unregistered tool: %s", name)
 
     def get(self, name: str) -> BaseTool:
@@ -192,10 +217,15 @@ class ToolRegistry:
     def get_llm_tools(self) -> list[LLMTool]:
         """Get all tools in LLM-compatible format.
 
+        The same list is returned until a tool is registered or unregistered,
+        which lets providers reuse their converted copy. Don't mutate it.
+
         Returns:
             List of Tool objects for passing to the LLM.
         """
-        return [tool.to_llm_tool() for tool in self._tools.values()]
+        if self._llm_tools is None:
+            self._llm_tools = [tool.to_llm_tool() for tool in self._tools.values()]
+        return self._llm_tools
 
     async def execute(self, name: str, **kwargs: object) -> str:
         """Execute a tool by name.
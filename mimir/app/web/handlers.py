@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+import functools
 from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING
 
+import orjson
 from aiohttp import web
 
 from ..ha.types import UserContext
 from ..utils.logging import get_logger
-from .templates import AUDIT_HTML, CHAT_HTML, GIT_HTML, STATUS_HTML
+from .templates import AUDIT_HTML, CHAT_HTML, GIT_HTML, STATUS_HTML, PageTemplate
 
 if TYPE_CHECKING:
     from ..db.repository import AuditRepository
@@ -20,6 +22,15 @@ logger = get_logger(__name__)
 # Type alias for aiohttp handler
 Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
 
+# Page templates, parsed once at import rather than on every request
+STATUS_PAGE = PageTemplate(STATUS_HTML)
+AUDIT_PAGE = PageTemplate(AUDIT_HTML)
+GIT_PAGE = PageTemplate(GIT_HTML)
+CHAT_PAGE = PageTemplate(CHAT_HTML)
+
+# Distinct rendered status pages kept; the inputs rarely change between polls
+STATUS_PAGE_CACHE_SIZE = 16
+
 
 def get_base_path(request: web.Request) -> str:
     """Extract the ingress base path from the request.
@@ -144,6 +155,37 @@ def setup_routes(app: web.Application) -> None:
 # ============== Main Pages ==============
 
 
+@functools.lru_cache(maxsize=STATUS_PAGE_CACHE_SIZE)
+def _render_status(
+    base_path: str,
+    version: str,
+    llm_provider: str,
+    llm_model: str,
+    operating_mode: str,
+    ha_connected: bool,
+    ws_connected: bool,
+    tool_count: int,
+) -> bytes:
+    """Render and encode the status page.
+
+    Memoized on every value the page shows, so repeated polls with
+    unchanged state reuse the same encoded body.
+    """
+    html = STATUS_PAGE.render(
+        base_path=base_path,
+        version=version,
+        llm_provider=llm_provider,
+        llm_model=llm_model,
+        operating_mode=operating_mode,
+        ha_status="Connected" if ha_connected else "Disconnected",
+        ha_status_class="status-ok" if ha_connected else "status-error",
+        ws_status="Connected" if ws_connected else "Disconnected",
+        ws_status_class="status-ok" if ws_connected else "status-error",
+        tool_count=tool_count,
+    )
+    return html.encode()
+
+
 async def handle_status(request: web.Request) -> web.Response:
     """Handle GET / - Main status page with chat."""
     agent = request.app.get("agent")
@@ -151,19 +193,17 @@ async def handle_status(request: web.Request) -> web.Response:
     if not agent:
         return web.Response(text="Agent not initialized", status=503)
 
-    html = STATUS_HTML.format(
-        base_path=get_base_path(request),
-        version=agent.VERSION,
-        llm_provider=agent._llm.name,
-        llm_model=agent._llm.model,
-        operating_mode=agent._config.operating_mode.value,
-        ha_status="Connected" if agent._ha_connected else "Disconnected",
-        ha_status_class="status-ok" if agent._ha_connected else "status-error",
-        ws_status="Connected" if agent._ws_connected else "Disconnected",
-        ws_status_class="status-ok" if agent._ws_connected else "status-error",
-        tool_count=len(agent._tool_registry),
+    body = _render_status(
+        get_base_path(request),
+        agent.VERSION,
+        agent._llm.name,
+        agent._llm.model,
+        agent._config.operating_mode.value,
+        agent._ha_connected,
+        agent._ws_connected,
+        len(agent._tool_registry),
     )
-    return web.Response(text=html, content_type="text/html")
+    return web.Response(body=body, content_type="text/html", charset="utf-8")
 
 
 async def handle_health(request: web.Request) -> web.Response:
@@ -173,7 +213,8 @@ async def handle_health(request: web.Request) -> web.Response:
     if not agent:
         return web.json_response({"status": "initializing"}, status=503)
 
-    return web.json_response(
+    # Polled by watchdogs; orjson encodes straight to the bytes aiohttp sends
+    body = orjson.dumps(
         {
             "status": "ok",
             "version": agent.VERSION,
@@ -181,6 +222,7 @@ async def handle_health(request: web.Request) -> web.Response:
             "ws_connected": agent._ws_connected,
         }
     )
+    return web.Response(body=body, content_type="application/json")
 
 
 async def handle_debug(request: web.Request) -> web.Response:
@@ -220,26 +262,23 @@ The ingress proxy is reaching Mímir successfully.
 
 async def handle_audit_page(request: web.Request) -> web.Response:
     """Handle GET /audit - Audit log page."""
-    # Call .format() to convert doubled braces {{}} to single braces {}
-    # and inject base_path for API URLs
-    html = AUDIT_HTML.format(base_path=get_base_path(request))
+    # Inject base_path for API URLs
+    html = AUDIT_PAGE.render(base_path=get_base_path(request))
     return web.Response(text=html, content_type="text/html")
 
 
 async def handle_git_page(request: web.Request) -> web.Response:
     """Handle GET /git - Git history page."""
-    # Call .format() to convert doubled braces {{}} to single braces {}
-    # and inject base_path for API URLs
-    html = GIT_HTML.format(base_path=get_base_path(request))
+    # Inject base_path for API URLs
+    html = GIT_PAGE.render(base_path=get_base_path(request))
     return web.Response(text=html, content_type="text/html")
 
 
 async def handle_chat_page(request: web.Request) -> web.Response:
     """Handle GET / or /chat - Chat page (default view for ingress)."""
     logger.info("Serving chat page for path: %s", request.path)
-    # Call .format() to convert doubled braces {{}} to single braces {}
-    # and inject base_path for API URLs
-    html = CHAT_HTML.format(base_path=get_base_path(request))
+    # Inject base_path for API URLs
+    html = CHAT_PAGE.render(base_path=get_base_path(request))
     return web.Response(text=html, content_type="text/html")
 
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import string
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -39,6 +40,56 @@ def _get_app_version() -> str:
 
 APP_VERSION = _get_app_version()
 
+
+class PageTemplate:
+    """A str.format() page template, parsed once.
+
+    The page templates are tens of kilobytes of HTML with a handful of
+    fields, so re-parsing them on every request is wasted work. Literal
+    text (with doubled braces already collapsed) is split out up front and
+    rendering only joins it with the field values.
+    """
+
+    def __init__(self, template: str) -> None:
+        """Parse the template.
+
+        Args:
+            template: Template using plain {name} fields; format specs and
+                conversions are not supported.
+
+        Raises:
+            ValueError: If a field uses a format spec or conversion.
+        """
+        segments: list[tuple[str, str | None]] = []
+        literal_parts: list[str] = []
+        for literal, field, spec, conversion in string.Formatter().parse(template):
+            literal_parts.append(literal)
+            if field is None:
+                continue
+            if spec or conversion:
+                raise ValueError(f"Unsupported template field: {{{field}}}")
+            segments.append(("".join(literal_parts), field))
+            literal_parts.clear()
+        segments.append(("".join(literal_parts), None))
+        self._segments = segments
+
+    def render(self, **values: object) -> str:
+        """Fill in the template fields.
+
+        Args:
+            **values: Value for each field; extra values are ignored.
+
+        Returns:
+            The rendered page.
+        """
+        parts: list[str] = []
+        for literal, field in self._segments:
+            parts.append(literal)
+            if field is not None:
+                parts.append(str(values[field]))
+        return "".join(parts)
+
+
 # JavaScript helper for constructing API URLs with ingress base path
 # This must be included at the start of every page that makes API calls
 BASE_PATH_SCRIPT = """
@@ -0,0 +1 @@
+"""Git manager tests for Mímir."""
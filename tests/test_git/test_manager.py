@@ -0,0 +1,70 @@
+"""Tests for the git manager."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from mimir.app.git.manager import GitConfig, GitManager
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+async def git_manager(tmp_path: Path) -> GitManager:
+    """Create a git manager on an initialized temporary repository."""
+    manager = GitManager(GitConfig(repo_path=str(tmp_path)))
+    assert await manager.initialize()
+    return manager
+
+
+class TestGenerateCommitMessage:
+    """Tests for GitManager.generate_commit_message."""
+
+    async def test_no_changes(self, git_manager: GitManager) -> None:
+        """Test message for a clean working tree."""
+        assert await git_manager.generate_commit_message() == "Update configuration"
+
+    async def test_added_files(self, git_manager: GitManager, tmp_path: Path) -> None:
+        """Test that untracked files count as added."""
+        (tmp_path / "automations.yaml").write_text("[]\n")
+        (tmp_path / "scripts.yaml").write_text("{}\n")
+
+        message = await git_manager.generate_commit_message()
+
+        assert message == "Add automations (1), scripts (1) - 2 file(s) changed"
+
+    async def test_modified_and_deleted(self, git_manager: GitManager, tmp_path: Path) -> None:
+        """Test that worktree modifications and deletions keep their status."""
+        (tmp_path / "configuration.yaml").write_text("a: 1\n")
+        (tmp_path / "packages").mkdir()
+        (tmp_path / "packages" / "scripts.yaml").write_text("{}\n")
+        (tmp_path / "old.yaml").write_text("b: 2\n")
+        await git_manager.commit("seed")
+
+        (tmp_path / "configuration.yaml").write_text("a: 2\n")
+        (tmp_path / "packages" / "scripts.yaml").write_text("{a: 1}\n")
+        (tmp_path / "old.yaml").unlink()
+
+        message = await git_manager.generate_commit_message()
+
+        assert message == "Update scripts (1), core config (1), other files (1) - 3 file(s) changed"
+
+
+class TestCommitHistory:
+    """Tests for commit log parsing."""
+
+    async def test_get_commits(self, git_manager: GitManager, tmp_path: Path) -> None:
+        """Test that log lines are parsed into commit dicts, newest first."""
+        (tmp_path / "automations.yaml").write_text("[]\n")
+        await git_manager.commit("Add automations")
+
+        commits = await git_manager.get_commits()
+        latest = await git_manager.get_latest_commit()
+
+        assert [c["message"] for c in commits] == ["Add automations", "Initial commit by Mimir"]
+        assert commits[0] == latest
+        assert latest["author"] == "Mimir"
+        assert len(latest["sha"]) == 40
@@ -0,0 +1,297 @@
+"""Tests for the Home Assistant REST API client."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from mimir.app.ha import api as api_module
+from mimir.app.ha.api import HomeAssistantAPI, HomeAssistantAPIError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+
+class FakeHomeAssistant:
+    """Minimal HA REST API that counts requests per path."""
+
+    def __init__(self) -> None:
+        self.hits: dict[str, int] = {}
+        self.url = ""
+        self.ws_connections = 0
+        self.ws_commands: list[dict[str, Any]] = []
+        self.delay = 0.0
+        self.app = web.Application()
+        self.app.router.add_get("/api/websocket", self._handle_ws)
+        self.app.router.add_route("*", "/api/{tail:.*}", self._handle)
+
+    async def _handle_ws(self, request: web.Request) -> web.WebSocketResponse:
+        self.ws_connections += 1
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        await ws.send_json({"type": "auth_required"})
+        auth = await ws.receive_json()
+        await ws.send_json(
+            {"type": "auth_ok" if auth["access_token"] == "token" else "auth_invalid"}
+        )
+        async for msg in ws:
+            command = msg.json()
+            self.ws_commands.append(command)
+            if command["type"] == "test/no_reply":
+                continue
+            result = [{"area_id": "kitchen"}] if command["type"].startswith("config/area") else []
+            await ws.send_json(
+                {"id": command["id"], "type": "result", "success": True, "result": result}
+            )
+        return ws
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.hits[request.path] = self.hits.get(request.path, 0) + 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if request.path == "/api/services":
+            await asyncio.sleep(0.01)
+            return web.json_response(
+                [{"domain": "light", "services": {"turn_on": {"name": "Turn on"}}}]
+            )
+        if request.path.startswith("/api/history/period"):
+            echo = {"entity_id": "sensor.echo", "state": request.query["filter_entity_id"]}
+            return web.json_response([[echo]])
+        body = await request.json() if request.body_exists else None
+        return web.json_response({"path": request.path, "query": dict(request.query), "body": body})
+
+
+@pytest.fixture
+async def fake_ha() -> AsyncGenerator[FakeHomeAssistant, None]:
+    """Run a fake Home Assistant server."""
+    fake = FakeHomeAssistant()
+    server = TestServer(fake.app)
+    await server.start_server()
+    fake.url = str(server.make_url(""))
+    yield fake
+    await server.close()
+
+
+@pytest.fixture
+async def api(
+    fake_ha: FakeHomeAssistant, monkeypatch: pytest.MonkeyPatch
+) -> AsyncGenerator[HomeAssistantAPI, None]:
+    """Create an API client pointed at the fake server."""
+    monkeypatch.delenv("SUPERVISOR_TOKEN", raising=False)
+    client = HomeAssistantAPI(url=fake_ha.url, token="token")
+    yield client
+    await client.close()
+
+
+class TestHomeAssistantAPI:
+    """Tests for HomeAssistantAPI."""
+
+    async def test_query_params_are_encoded(self, api: HomeAssistantAPI) -> None:
+        """Test that logbook filters are sent as encoded query parameters."""
+        result: Any = await api.get_logbook(
+            entity_id="light.kitchen",
+            start_time="2025-01-10T12:00:00+00:00",
+            end_time="2025-01-11T12:00:00+00:00",
+        )
+
+        assert result["path"] == "/api/logbook/2025-01-10T12:00:00+00:00"
+        assert result["query"] == {
+            "entity": "light.kitchen",
+            "end_time": "2025-01-11T12:00:00+00:00",
+        }
+
+    async def test_services_are_memoized(
+        self, api: HomeAssistantAPI, fake_ha: FakeHomeAssistant
+    ) -> None:
+        """Test that repeated and concurrent service lookups share one request."""
+        first, second = await asyncio.gather(api.get_services(), api.get_services())
+        third = await api.get_services()
+
+        assert fake_ha.hits["/api/services"] == 1
+        assert first is second is third
+        assert first["light"][0].full_name == "light.turn_on"
+
+    async def test_write_invalidates_cache(
+        self, api: HomeAssistantAPI, fake_ha: FakeHomeAssistant
+    ) -> None:
+        """Test that a POST drops memoized responses."""
+        await api.get_services()
+        await api.call_service("script", "reload")
+        await api.get_services()
+
+        assert fake_ha.hits["/api/services"] == 2
+
+    async def test_ws_connection_is_reused(
+        self, api: HomeAssistantAPI, fake_ha: FakeHomeAssistant
+    ) -> None:
+        """Test that WebSocket commands share one authenticated connection."""
+        areas = await api.get_areas()
+        labels = await api.get_labels()
+
+        assert areas == [{"area_id": "kitchen"}]
+        assert labels == []
+        assert fake_ha.ws_connections == 1
+        assert [c["id"] for c in fake_ha.ws_commands] == [1, 2]
+
+    async def test_registry_lists_memoized(
+        self, api: HomeAssistantAPI, fake_ha: FakeHomeAssistant
+    ) -> None:
+        """Test that registry lists are cached until an entity update."""
+        await api.get_areas()
+        await api.get_areas()
+        await api.update_entity_registry("light.desk", name="Desk")
+        await api.get_areas()
+
+        assert [c["type"] for c in fake_ha.ws_commands] == [
+            "config/area_registry/list",
+            "config/entity_registry/update",
+            "config/area_registry/list",
+        ]
+
+    async def test_get_registries_batches_commands(
+        self, api: HomeAssistantAPI, fake_ha: FakeHomeAssistant
+    ) -> None:
+        """Test that the registry lookups are pipelined over one connection."""
+        entities, areas, labels = await api.get_registries()
+
+        assert entities == []
+        assert areas == [{"area_id": "kitchen"}]
+        assert labels == []
+        assert fake_ha.ws_connections == 1
+        assert [c["type"] for c in fake_ha.ws_commands] == [
+            "config/entity_registry/list",
+            "config/area_registry/list",
+            "config/label_registry/list",
+        ]
+
+    async def test_ws_command_timeout_unregisters_id(
+        self, api: HomeAssistantAPI, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a command without a reply doesn't stay pending after timing out."""
+        monkeypatch.setattr(api_module, "WS_COMMAND_TIMEOUT", 0.05)
+
+        with pytest.raises(HomeAssistantAPIError, match="timed out"):
+            await api._ws_command("test/no_reply")
+        await asyncio.sleep(0)
+
+        assert api._ws_pending == {}
+
+    async def test_ws_batch_timeout_unregisters_ids(
+        self, api: HomeAssistantAPI, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a timed-out batch unregisters every command it sent."""
+        monkeypatch.setattr(api_module, "WS_COMMAND_TIMEOUT", 0.05)
+
+        with pytest.raises(HomeAssistantAPIError, match="timed out"):
+            await api._ws_commands_batch([("config/area_registry/list", {}), ("test/no_reply", {})])
+        await asyncio.sleep(0)
+
+        assert api._ws_pending == {}
+
+    async def test_set_token_updates_session_headers(self, api: HomeAssistantAPI) -> None:
+        """Test that a rotated token is used by the existing session."""
+        session = await api._ensure_session()
+
+        api.set_token("rotated")
+
+        assert session.headers["Authorization"] == "Bearer rotated"
+
+    @pytest.mark.parametrize(
+        ("object_id", "domain", "expected"),
+        [
+            ("automation.morning", "automation", "morning"),
+            ("morning", "automation", "morning"),
+            ("automationx.morning", "automation", "automationx.morning"),
+            ("input_boolean.guest", "input_boolean", "guest"),
+            ("script.wake", "scene", "script.wake"),
+        ],
+    )
+    def test_strip_prefix(self, object_id: str, domain: str, expected: str) -> None:
+        """Test that only an exact '<domain>.' prefix is removed."""
+        assert HomeAssistantAPI._strip_prefix(object_id, domain) == expected
+
+    async def test_config_crud_path(self, api: HomeAssistantAPI) -> None:
+        """Test that CRUD helpers build the config path from the stripped ID."""
+        result: Any = await api.get_scene_config("scene.movie_night")
+
+        assert result["path"] == "/api/config/scene/config/movie_night"
+
+    async def test_history_filter_params(self, api: HomeAssistantAPI) -> None:
+        """Test that history filters are passed as query parameters, in order."""
+        history = await api.get_history(["sensor.b", "sensor.a"])
+
+        assert history[0][0].state == "sensor.b,sensor.a"
+
+    async def test_iter_history(self, api: HomeAssistantAPI) -> None:
+        """Test that iter_history yields EntityState objects lazily."""
+        states = [state async for state in api.iter_history(["sensor.a"])]
+
+        assert [s.entity_id for s in states] == ["sensor.echo"]
+        assert states[0].state == "sensor.a"
+
+    async def test_update_entity_registry_fields(
+        self, api: HomeAssistantAPI, fake_ha: FakeHomeAssistant
+    ) -> None:
+        """Test that only given fields are sent and an empty area clears it."""
+        await api.update_entity_registry("light.desk", area_id="", icon="mdi:lamp")
+
+        command = fake_ha.ws_commands[-1]
+        del command["id"]
+        assert command == {
+            "type": "config/entity_registry/update",
+            "entity_id": "light.desk",
+            "area_id": None,
+            "icon": "mdi:lamp",
+        }
+
+    async def test_create_automations_bulk(self, api: HomeAssistantAPI) -> None:
+        """Test that bulk creation returns one result per item, in order."""
+        results: Any = await api.create_automations({"automation.a": {}, "b": {}})
+
+        assert [r["path"] for r in results] == [
+            "/api/config/automation/config/a",
+            "/api/config/automation/config/b",
+        ]
+
+    async def test_ping(self, api: HomeAssistantAPI) -> None:
+        """Test that ping reports a reachable server."""
+        assert await api.ping() is True
+
+    async def test_ping_timeout_returns_false(
+        self, api: HomeAssistantAPI, fake_ha: FakeHomeAssistant, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that ping reports a server slower than the timeout as unreachable."""
+        monkeypatch.setattr(api_module, "REQUEST_TIMEOUT", 0.05)
+        fake_ha.delay = 1.0
+
+        assert await api.ping() is False
+
+    async def test_request_timeout_raises_api_error(
+        self, api: HomeAssistantAPI, fake_ha: FakeHomeAssistant, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a timed-out request surfaces as HomeAssistantAPIError."""
+        monkeypatch.setattr(api_module, "REQUEST_TIMEOUT", 0.05)
+        fake_ha.delay = 1.0
+
+        with pytest.raises(HomeAssistantAPIError, match="timeout"):
+            await api.get_error_log()
+
+    async def test_cached_get_timeout_raises_api_error(
+        self, api: HomeAssistantAPI, fake_ha: FakeHomeAssistant, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a timed-out memoized GET surfaces as HomeAssistantAPIError."""
+        monkeypatch.setattr(api_module, "REQUEST_TIMEOUT", 0.05)
+        fake_ha.delay = 1.0
+
+        with pytest.raises(HomeAssistantAPIError, match="timeout"):
+            await api.get_services()
+
+    async def test_post_body_is_json(self, api: HomeAssistantAPI) -> None:
+        """Test that request bodies are sent as JSON."""
+        result: Any = await api.create_scene("movie_night", {"entities": {"light.tv": "on"}})
+
+        assert result["body"] == {"entities": {"light.tv": "on"}}
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
+
 from mimir.app.ha.types import Entity, EntityState, Event, Service, TelegramMessage
 
 
@@ -35,6 +37,19 @@ class TestEntityState:
         assert state.last_changed is not None
         assert state.last_updated is not None
 
+    def test_from_dict_with_utc_suffix(self) -> None:
+        """Test that 'Z'-suffixed timestamps parse as UTC."""
+        data = {
+            "entity_id": "sensor.temperature",
+            "state": "22.5",
+            "attributes": {},
+            "last_changed": "2025-01-10T12:00:00Z",
+        }
+        state = EntityState.from_dict(data)
+
+        assert state.last_changed is not None
+        assert state.last_changed.utcoffset() == timedelta(0)
+
 
 class TestEntity:
     """Tests for Entity class."""
@@ -0,0 +1,195 @@
+"""Tests for the Home Assistant WebSocket client."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from mimir.app.ha.types import Event
+from mimir.app.ha.websocket import HomeAssistantWebSocket
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+
+class FakeHomeAssistantWebSocket:
+    """Minimal Home Assistant WebSocket API.
+
+    Every command succeeds; subscribing also fires one event of that type.
+    """
+
+    def __init__(self) -> None:
+        self.url = ""
+        self.app = web.Application()
+        self.app.router.add_get("/api/websocket", self._handle_ws)
+
+    async def _handle_ws(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        await ws.send_json({"type": "auth_required"})
+        await ws.receive_json()
+        await ws.send_json({"type": "auth_ok"})
+        async for msg in ws:
+            command: dict[str, Any] = msg.json()
+            await ws.send_json(
+                {"id": command["id"], "type": "result", "success": True, "result": {"ok": 1}}
+            )
+            if command["type"] == "subscribe_events":
+                event = {"event_type": command["event_type"], "data": {"text": "hi"}}
+                await ws.send_json({"id": command["id"], "type": "event", "event": event})
+        return ws
+
+
+@pytest.fixture
+async def fake_ws() -> AsyncGenerator[FakeHomeAssistantWebSocket, None]:
+    """Run a fake Home Assistant WebSocket server."""
+    fake = FakeHomeAssistantWebSocket()
+    server = TestServer(fake.app)
+    await server.start_server()
+    fake.url = str(server.make_url("")).rstrip("/")
+    yield fake
+    await server.close()
+
+
+@pytest.fixture
+def ws_client(monkeypatch: pytest.MonkeyPatch) -> HomeAssistantWebSocket:
+    """Create a WebSocket client that is never connected."""
+    monkeypatch.delenv("SUPERVISOR_TOKEN", raising=False)
+    return HomeAssistantWebSocket(url="http://localhost:8123", token="token")
+
+
+class TestEventDispatch:
+    """Tests for event handler dispatch."""
+
+    async def test_catch_all_handlers_run_once_per_event(
+        self, ws_client: HomeAssistantWebSocket
+    ) -> None:
+        """Test that repeated dispatches don't accumulate catch-all handlers."""
+        calls: list[str] = []
+
+        async def specific(event: Event) -> None:
+            calls.append(f"specific:{event.event_type}")
+
+        async def catch_all(event: Event) -> None:
+            calls.append(f"all:{event.event_type}")
+
+        ws_client.on_event("telegram_text", specific)
+        ws_client.on_event("*", catch_all)
+
+        event = Event(event_type="telegram_text", data={})
+        await ws_client._dispatch_event(event)
+        await ws_client._dispatch_event(event)
+
+        assert calls == [
+            "specific:telegram_text",
+            "all:telegram_text",
+            "specific:telegram_text",
+            "all:telegram_text",
+        ]
+
+    async def test_handler_registered_after_dispatch(
+        self, ws_client: HomeAssistantWebSocket
+    ) -> None:
+        """Test that a newly registered handler sees subsequent events."""
+        calls: list[str] = []
+
+        async def handler(event: Event) -> None:
+            calls.append(event.event_type)
+
+        await ws_client._dispatch_event(Event(event_type="telegram_command", data={}))
+        ws_client.on_event("telegram_command", handler)
+        await ws_client._dispatch_event(Event(event_type="telegram_command", data={}))
+
+        assert calls == ["telegram_command"]
+
+    async def test_failing_handler_does_not_block_others(
+        self, ws_client: HomeAssistantWebSocket
+    ) -> None:
+        """Test that one handler raising doesn't stop the remaining handlers."""
+        calls: list[str] = []
+
+        async def failing(event: Event) -> None:  # noqa: ARG001
+            raise RuntimeError("boom")
+
+        async def handler(event: Event) -> None:
+            calls.append(event.event_type)
+
+        ws_client.on_event("telegram_text", failing)
+        ws_client.on_event("telegram_text", handler)
+
+        await ws_client._dispatch_event(Event(event_type="telegram_text", data={}))
+
+        assert calls == ["telegram_text"]
+
+    async def test_cancelled_handler_is_logged(
+        self, ws_client: HomeAssistantWebSocket, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that a handler ending in CancelledError is reported, not dropped."""
+        calls: list[str] = []
+
+        async def cancelled(event: Event) -> None:  # noqa: ARG001
+            raise asyncio.CancelledError
+
+        async def handler(event: Event) -> None:
+            calls.append(event.event_type)
+
+        ws_client.on_event("telegram_text", cancelled)
+        ws_client.on_event("telegram_text", handler)
+
+        await ws_client._dispatch_event(Event(event_type="telegram_text", data={}))
+
+        assert calls == ["telegram_text"]
+        assert "CancelledError" in caplog.text
+
+    async def test_event_worker_dispatches_queued_events(
+        self, ws_client: HomeAssistantWebSocket
+    ) -> None:
+        """Test that events queued by the reader reach their handlers."""
+        received: asyncio.Queue[Event] = asyncio.Queue()
+
+        async def handler(event: Event) -> None:
+            await received.put(event)
+
+        ws_client.on_event("telegram_text", handler)
+        worker = asyncio.create_task(ws_client._event_worker())
+        try:
+            await ws_client._event_queue.put(
+                {"event_type": "telegram_text", "data": {"text": "hi"}}
+            )
+            event = await asyncio.wait_for(received.get(), timeout=1)
+        finally:
+            worker.cancel()
+
+        assert event.data == {"text": "hi"}
+
+
+class TestConnection:
+    """Tests against a fake Home Assistant WebSocket server."""
+
+    async def test_run_subscribes_and_dispatches(
+        self, fake_ws: FakeHomeAssistantWebSocket, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that run() subscribes, dispatches events and answers commands."""
+        monkeypatch.delenv("SUPERVISOR_TOKEN", raising=False)
+        client = HomeAssistantWebSocket(url=fake_ws.url, token="token")
+        received: asyncio.Queue[Event] = asyncio.Queue()
+
+        async def handler(event: Event) -> None:
+            await received.put(event)
+
+        client.on_event("telegram_text", handler)
+        runner = asyncio.create_task(client.run())
+        try:
+            event = await asyncio.wait_for(received.get(), timeout=2)
+            result = await client.send_command("ping")
+        finally:
+            await client.stop()
+            await asyncio.wait_for(runner, timeout=2)
+
+        assert event.data == {"text": "hi"}
+        assert result == {"ok": 1}
+        assert sorted(client._subscriptions.values()) == ["telegram_command", "telegram_text"]
@@ -0,0 +1,99 @@
+"""Tests for the Anthropic provider."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace as NS
+from typing import TYPE_CHECKING, Any
+
+from mimir.app.llm.anthropic import AnthropicProvider
+from mimir.app.llm.types import Message, StopReason
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    import pytest
+
+
+def _events() -> list[Any]:
+    """Raw stream events for a text block followed by a tool call."""
+    usage = NS(input_tokens=12, output_tokens=1)
+    return [
+        NS(type="message_start", message=NS(model="claude-test", usage=usage)),
+        NS(type="content_block_start", content_block=NS(type="text")),
+        NS(type="content_block_delta", delta=NS(type="text_delta", text="Hel")),
+        NS(type="content_block_delta", delta=NS(type="text_delta", text="lo")),
+        NS(type="content_block_stop"),
+        NS(type="content_block_start", content_block=NS(type="tool_use", id="t1", name="get")),
+        NS(type="content_block_delta", delta=NS(type="input_json_delta", partial_json='{"a"')),
+        NS(type="content_block_delta", delta=NS(type="input_json_delta", partial_json=": 1}")),
+        NS(type="content_block_stop"),
+        NS(type="message_delta", delta=NS(stop_reason="tool_use"), usage=NS(output_tokens=30)),
+        NS(type="message_stop"),
+    ]
+
+
+class _FakeStream:
+    """Stand-in for the SDK's AsyncStream over a fixed list of events."""
+
+    def __init__(self, events: list[Any]) -> None:
+        self._events = events
+        self.closed = False
+
+    async def __aenter__(self) -> _FakeStream:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.closed = True
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        for event in self._events:
+            yield event
+
+
+class TestStream:
+    """Tests for AnthropicProvider.stream."""
+
+    async def test_builds_final_response_from_events(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that deltas, tool calls and the final response come from raw events."""
+        provider = AnthropicProvider(api_key="key")
+
+        stream = _FakeStream(_events())
+
+        async def create(**kwargs: Any) -> _FakeStream:
+            assert kwargs["stream"] is True
+            return stream
+
+        monkeypatch.setattr(provider._client.messages, "create", create)
+
+        chunks = [chunk async for chunk in provider.stream([Message.user("hi")])]
+
+        text = "".join(chunk.delta_content for chunk in chunks if chunk.delta_content)
+        final = chunks[-1].response
+        assert text == "Hello"
+        assert final is not None
+        assert final.content == "Hello"
+        assert final.stop_reason == StopReason.TOOL_USE
+        assert final.tool_calls is not None
+        assert final.tool_calls[0].arguments == {"a": 1}
+        assert (final.usage.input_tokens, final.usage.output_tokens) == (12, 30)
+        assert final.model == "claude-test"
+        assert stream.closed
+
+    async def test_closes_stream_when_consumer_stops_early(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the HTTP stream is released when iteration is abandoned."""
+        provider = AnthropicProvider(api_key="key")
+        stream = _FakeStream(_events())
+
+        async def create(**kwargs: Any) -> _FakeStream:  # noqa: ARG001
+            return stream
+
+        monkeypatch.setattr(provider._client.messages, "create", create)
+
+        chunks = provider.stream([Message.user("hi")])
+        async for _ in chunks:
+            break
+        await chunks.aclose()
+
+        assert stream.closed
@@ -0,0 +1,64 @@
+"""Tests for shared LLM provider helpers."""
+
+from __future__ import annotations
+
+import gc
+from typing import TYPE_CHECKING
+
+from mimir.app.llm.base import MessageCache
+from mimir.app.llm.types import Message
+
+if TYPE_CHECKING:
+    from mimir.app.llm.types import CompletionRequest
+
+    from ..conftest import MockLLMProvider
+
+
+class TestMessageCache:
+    """Tests for MessageCache."""
+
+    def test_converts_each_message_once(self) -> None:
+        """Test that history messages are only converted on first sight."""
+        calls: list[Message] = []
+
+        def convert(msg: Message) -> str:
+            calls.append(msg)
+            return str(msg.content)
+
+        cache = MessageCache(convert)
+        history = [Message.user("hi"), Message.assistant("hello")]
+
+        assert cache.convert(history) == ["hi", "hello"]
+        history.append(Message.user("bye"))
+        assert cache.convert(history) == ["hi", "hello", "bye"]
+        assert len(calls) == 3
+
+    def test_skips_none_and_drops_collected_messages(self) -> None:
+        """Test that skipped messages are omitted and dead messages evicted."""
+        cache: MessageCache[str] = MessageCache(lambda _msg: None)
+        history = [Message.user("hi")]
+
+        assert cache.convert(history) == []
+        assert len(cache) == 1
+
+        history.clear()
+        gc.collect()
+
+        assert len(cache) == 0
+
+
+class TestCompleteMany:
+    """Tests for LLMProvider.complete_many."""
+
+    async def test_returns_responses_in_request_order(
+        self, mock_llm_provider: MockLLMProvider
+    ) -> None:
+        """Test that every request is completed and results keep request order."""
+        requests: list[CompletionRequest] = [
+            {"messages": [Message.user(str(i))], "system": str(i)} for i in range(5)
+        ]
+
+        responses = await mock_llm_provider.complete_many(requests, max_concurrency=2)
+
+        assert len(responses) == 5
+        assert sorted(call["system"] for call in mock_llm_provider.calls) == list("01234")
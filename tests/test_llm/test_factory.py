@@ -0,0 +1,48 @@
+"""Tests for the LLM provider factory."""
+
+from __future__ import annotations
+
+import pytest
+from pydantic import SecretStr
+
+from mimir.app.config import LLMConfig
+from mimir.app.config import LLMProvider as LLMProviderEnum
+from mimir.app.llm.anthropic import AnthropicProvider
+from mimir.app.llm.factory import (
+    PROVIDER_BUILDERS,
+    UnsupportedProviderError,
+    create_provider,
+)
+from mimir.app.llm.local import OllamaProvider
+
+
+class TestCreateProvider:
+    """Tests for create_provider."""
+
+    def test_every_provider_has_a_builder(self) -> None:
+        """Test that each configurable provider can be dispatched."""
+        assert set(PROVIDER_BUILDERS) == set(LLMProviderEnum)
+
+    def test_creates_anthropic_provider(self) -> None:
+        """Test creating the default provider."""
+        provider = create_provider(LLMConfig(api_key=SecretStr("key"), model="claude-test"))
+
+        assert isinstance(provider, AnthropicProvider)
+        assert provider.model == "claude-test"
+
+    def test_azure_requires_base_url(self) -> None:
+        """Test that Azure without an endpoint is rejected."""
+        config = LLMConfig(provider=LLMProviderEnum.AZURE, api_key=SecretStr("key"))
+
+        with pytest.raises(UnsupportedProviderError):
+            create_provider(config)
+
+    def test_creates_ollama_provider_with_default_url(self) -> None:
+        """Test that local providers reuse the OpenAI-compatible implementation."""
+        config = LLMConfig(provider=LLMProviderEnum.OLLAMA, api_key=SecretStr(""), model="llama3.2")
+
+        provider = create_provider(config)
+
+        assert isinstance(provider, OllamaProvider)
+        assert provider.name == "ollama"
+        assert str(provider._client.base_url) == "http://localhost:11434/v1/"
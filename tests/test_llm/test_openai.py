@@ -0,0 +1,62 @@
+"""Tests for the OpenAI provider."""
+
+from __future__ import annotations
+
+from mimir.app.llm.openai import OpenAIProvider
+from mimir.app.llm.types import ContentBlock, Message, Role, ToolCall, ToolResult
+
+
+class TestConvertMessages:
+    """Tests for OpenAIProvider message conversion."""
+
+    def test_converts_tool_round_trip(self) -> None:
+        """Test system prompt, tool calls and one tool message per result."""
+        provider = OpenAIProvider(api_key="key")
+        results = [
+            ContentBlock(type="tool_result", tool_result=ToolResult("a", "1")),
+            ContentBlock(type="tool_result", tool_result=ToolResult("b", "2")),
+        ]
+        messages = [
+            Message.user("hi"),
+            Message.assistant(tool_calls=[ToolCall(id="a", name="get", arguments={"x": 1})]),
+            Message(role=Role.USER, content=results),
+        ]
+
+        converted = provider._convert_messages(messages, system="be brief")
+
+        assert [m["role"] for m in converted] == ["system", "user", "assistant", "tool", "tool"]
+        assert converted[2]["content"] is None
+        assert converted[2]["tool_calls"][0]["function"]["arguments"] == '{"x":1}'
+        assert [m["tool_call_id"] for m in converted[3:]] == ["a", "b"]
+
+    def test_history_converted_once(self) -> None:
+        """Test that earlier turns are reused rather than rebuilt."""
+        provider = OpenAIProvider(api_key="key")
+        history = [Message.user("hi"), Message.assistant("hello")]
+
+        first = provider._convert_messages(history)
+        history.append(Message.user("bye"))
+        second = provider._convert_messages(history)
+
+        assert second[:2] == first
+        assert second[0] is first[0]
+        assert len(provider._message_cache) == 3
+
+
+class TestRequestKwargs:
+    """Tests for OpenAIProvider request arguments."""
+
+    def test_overrides_do_not_leak_into_defaults(self) -> None:
+        """Test that per-call overrides leave the provider defaults intact."""
+        provider = OpenAIProvider(api_key="key", model="gpt-test", max_tokens=100)
+
+        first = provider._request_kwargs([Message.user("hi")], None, None, 50, 0.0)
+        second = provider._request_kwargs([Message.user("hi")], None, None, None, None)
+
+        assert (first["max_tokens"], first["temperature"]) == (50, 0.0)
+        assert (second["model"], second["max_tokens"], second["temperature"]) == (
+            "gpt-test",
+            100,
+            0.7,
+        )
+        assert "tools" not in second
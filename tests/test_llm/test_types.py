@@ -84,6 +84,7 @@ class TestTool:
         assert openai_format["type"] == "function"
         assert openai_format["function"]["name"] == "test_tool"
         assert openai_format["function"]["description"] == "A test tool"
+        assert tool.to_openai_format() is openai_format
 
 
 class TestResponse:
@@ -59,6 +59,17 @@ class TestToolRegistry:
         assert "test_tool" not in registry
         assert len(registry) == 0
 
+    def test_register_many(self) -> None:
+        """Test registering several tools in one call."""
+        registry = ToolRegistry()
+        registry.register(MockTool(name="tool1"))
+        before = registry.get_llm_tools()
+
+        registry.register_many([MockTool(name="tool2"), MockTool(name="tool3")])
+
+        assert len(registry) == 3
+        assert registry.get_llm_tools() is not before
+
     def test_tool_names(self) -> None:
         """Test getting tool names."""
         registry = ToolRegistry()
@@ -102,3 +113,17 @@ class TestToolRegistry:
 
         with pytest.raises(ToolNotFoundError):
             await registry.execute("nonexistent", query="test")
+
+    def test_get_llm_tools_reused_until_registry_changes(self) -> None:
+        """Test that the LLM tool list is only rebuilt after registry changes."""
+        registry = ToolRegistry()
+        registry.register(MockTool(name="tool1"))
+
+        first = registry.get_llm_tools()
+        assert registry.get_llm_tools() is first
+
+        registry.register(MockTool(name="tool2"))
+        second = registry.get_llm_tools()
+
+        assert second is not first
+        assert [tool.name for tool in second] == ["tool1", "tool2"]
@@ -0,0 +1,36 @@
+"""Tests for the web page templates."""
+
+from __future__ import annotations
+
+import pytest
+
+from mimir.app.web.templates import AUDIT_HTML, STATUS_HTML, PageTemplate
+
+STATUS_VALUES = {
+    "base_path": "/api/hassio_ingress/abc",
+    "version": "1.0.0",
+    "llm_provider": "anthropic",
+    "llm_model": "claude",
+    "operating_mode": "normal",
+    "ha_status": "Connected",
+    "ha_status_class": "status-ok",
+    "ws_status": "Disconnected",
+    "ws_status_class": "status-error",
+    "tool_count": 12,
+}
+
+
+class TestPageTemplate:
+    """Tests for PageTemplate."""
+
+    def test_matches_str_format(self) -> None:
+        """Test that rendering matches str.format on the real pages."""
+        assert PageTemplate(STATUS_HTML).render(**STATUS_VALUES) == STATUS_HTML.format(
+            **STATUS_VALUES
+        )
+        assert PageTemplate(AUDIT_HTML).render(base_path="/x") == AUDIT_HTML.format(base_path="/x")
+
+    def test_rejects_format_specs(self) -> None:
+        """Test that fields with format specs are refused at parse time."""
+        with pytest.raises(ValueError):
+            PageTemplate("{count:>5}")